@@ -19,22 +19,48 @@ Author: Shamsuddin Ahmed
 License: MIT
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
 from cosmicexcuse.__version__ import __version__
-from cosmicexcuse.analyzer import SeverityAnalyzer
-from cosmicexcuse.exceptions import (
-    CosmicExcuseError,
-    DataLoadError,
-    LanguageNotSupportedError,
-)
-from cosmicexcuse.formatter import ExcuseFormatter, HaikuFormatter
-from cosmicexcuse.generator import CosmicExcuse, ExcuseGenerator
-from cosmicexcuse.leaderboard import ExcuseLeaderboard
-from cosmicexcuse.markov import MarkovChain
+
+if TYPE_CHECKING:
+    from cosmicexcuse.analyzer import SeverityAnalyzer
+    from cosmicexcuse.exceptions import (
+        CosmicExcuseError,
+        DataLoadError,
+        LanguageNotSupportedError,
+    )
+    from cosmicexcuse.formatter import ExcuseFormatter, HaikuFormatter
+    from cosmicexcuse.generator import (
+        CosmicExcuse,
+        ExcuseGenerator,
+        get_cached_generator,
+    )
+    from cosmicexcuse.leaderboard import ExcuseLeaderboard
+    from cosmicexcuse.markov import MarkovChain
+
+# Public names are imported from their submodule on first access, so light
+# entry points (e.g. ``cosmicexcuse --version``) skip loading the generator.
+_LAZY_ATTRIBUTES = {
+    "SeverityAnalyzer": "cosmicexcuse.analyzer",
+    "CosmicExcuseError": "cosmicexcuse.exceptions",
+    "DataLoadError": "cosmicexcuse.exceptions",
+    "LanguageNotSupportedError": "cosmicexcuse.exceptions",
+    "ExcuseFormatter": "cosmicexcuse.formatter",
+    "HaikuFormatter": "cosmicexcuse.formatter",
+    "CosmicExcuse": "cosmicexcuse.generator",
+    "ExcuseGenerator": "cosmicexcuse.generator",
+    "get_cached_generator": "cosmicexcuse.generator",
+    "ExcuseLeaderboard": "cosmicexcuse.leaderboard",
+    "MarkovChain": "cosmicexcuse.markov",
+}
 
 __all__ = [
     "__version__",
     "CosmicExcuse",
     "ExcuseGenerator",
+    "get_cached_generator",
     "SeverityAnalyzer",
     "MarkovChain",
     "ExcuseFormatter",
@@ -46,6 +72,19 @@ __all__ = [
 ]
 
 
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
 # Convenience function for quick usage
 def generate(error_message: str = "", language: str = "en") -> str:
     """
@@ -62,6 +101,8 @@ def generate(error_message: str = "", language: str = "en") -> str:
         >>> import cosmicexcuse
         >>> print(cosmicexcuse.generate("Segmentation fault"))
     """
-    generator = CosmicExcuse(language=language)
-    excuse = generator.generate(error_message)
+    from cosmicexcuse.generator import get_cached_generator
+
+    generator = get_cached_generator(language)
+    excuse = generator.generate(error_message, save_history=False)
     return excuse.text
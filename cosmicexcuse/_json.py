@@ -0,0 +1,75 @@
+"""
+JSON helpers that use orjson when it is installed.
+"""
+
+import json
+from types import ModuleType
+from typing import Any, Optional, Union
+
+orjson: Optional[ModuleType]
+try:  # Optional C-accelerated JSON codec
+    import orjson
+except ImportError:  # pragma: no cover - exercised when the extra is missing
+    orjson = None
+
+# Raised for malformed input by either backend (orjson subclasses it)
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: JSON text, as str or UTF-8 bytes
+
+    Returns:
+        The decoded Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumpb(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON, keeping non-ASCII characters.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with a two-space indent
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        encoded: bytes = orjson.dumps(obj, option=option)
+        return encoded
+    return _stdlib_dumps(obj, indent).encode("utf-8")
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize an object to JSON text, keeping non-ASCII characters as-is.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with a two-space indent
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        encoded: bytes = orjson.dumps(obj, option=option)
+        return encoded.decode("utf-8")
+    return _stdlib_dumps(obj, indent)
+
+
+def _stdlib_dumps(obj: Any, indent: bool) -> str:
+    """Serialize with the json module, formatted exactly as orjson would."""
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    # orjson's compact output has no space after ',' or ':'
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
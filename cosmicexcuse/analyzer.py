@@ -4,8 +4,71 @@ Error severity analyzer module.
 
 from __future__ import annotations
 
+import functools
 import re
-from typing import Any, Dict, Iterable, List, Tuple
+import string
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+)
+
+try:  # Optional C-accelerated multi-keyword matcher
+    import ahocorasick  # type: ignore
+except ImportError:  # pragma: no cover - exercised when the extra is missing
+    ahocorasick = None
+
+
+@dataclass(frozen=True)
+class _PreparedMessage:
+    """Derived forms of a message, computed once and shared by all scorers."""
+
+    raw: str
+    lower: str
+    shouted: Tuple[str, ...]
+    exclamations: int
+    uppercase: int
+
+
+_ASCII_UPPERCASE = string.ascii_uppercase.encode("ascii")
+
+
+def _count_uppercase(message: str) -> int:
+    """Count uppercase characters, deleting ASCII capitals in one C call."""
+    if message.isascii():
+        raw = message.encode("ascii")
+        return len(raw) - len(raw.translate(None, _ASCII_UPPERCASE))
+    return sum(map(str.isupper, message))
+
+
+def _lowercase_pattern(pattern: str) -> str:
+    """Lowercase a regex pattern, leaving escape sequences such as ``\\W`` intact."""
+    return re.sub(
+        r"\\.|[^\\]+",
+        lambda m: m.group() if m.group().startswith("\\") else m.group().lower(),
+        pattern,
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _prepare(message: str) -> _PreparedMessage:
+    # The counts run as C-level scans; a per-character Python loop that fuses
+    # them would visit the string once but is far slower.
+    return _PreparedMessage(
+        raw=message,
+        lower=message.lower(),
+        # Words longer than two characters written entirely in capitals
+        shouted=tuple(w for w in message.split() if len(w) > 2 and w.isupper()),
+        exclamations=message.count("!"),
+        uppercase=_count_uppercase(message),
+    )
 
 
 class SeverityAnalyzer:
@@ -13,6 +76,9 @@ class SeverityAnalyzer:
     Analyzes error messages to determine severity level.
     """
 
+    # Upper bound on memoized messages per analyzer instance
+    CACHE_SIZE = 1024
+
     def __init__(self) -> None:
         """Initialize the severity analyzer."""
         self.severity_keywords: Dict[str, List[str]] = {
@@ -78,6 +144,8 @@ class SeverityAnalyzer:
             ],
         }
 
+        # Gaps between words are bounded (.{0,64}?) rather than .* so long
+        # messages cannot trigger quadratic backtracking.
         self.severity_patterns: Dict[str, List[str]] = {
             "severe": [
                 r"FATAL",
@@ -85,10 +153,10 @@ class SeverityAnalyzer:
                 r"PANIC",
                 r"EMERGENCY",
                 r"!!!+",
-                r"SYSTEM.*DOWN",
-                r"KERNEL.*PANIC",
-                r"SEGMENTATION.*FAULT",
-                r"CORE.*DUMP",
+                r"SYSTEM.{0,64}?DOWN",
+                r"KERNEL.{0,64}?PANIC",
+                r"SEGMENTATION.{0,64}?FAULT",
+                r"CORE.{0,64}?DUMP",
             ],
             "medium": [
                 r"\bERROR\b",
@@ -96,9 +164,9 @@ class SeverityAnalyzer:
                 r"FAILED",
                 r"!!",
                 r"\bFAIL\b",
-                r"NULL.*POINTER",
-                r"STACK.*OVERFLOW",
-                r"MEMORY.*LEAK",
+                r"NULL.{0,64}?POINTER",
+                r"STACK.{0,64}?OVERFLOW",
+                r"MEMORY.{0,64}?LEAK",
             ],
             "mild": [
                 r"\bWARN(ING)?\b",
@@ -116,6 +184,72 @@ class SeverityAnalyzer:
         self._keyword_weights = {"severe": 3, "medium": 2, "mild": 1}
         self._uppercase_exclusions = {"CPU", "RAM", "API", "URL", "ID"}
 
+        # Compile every pattern once, plus one fused alternation per severity
+        # so buckets without any hit are rejected in a single regex scan.
+        # Patterns are lowercased and matched against the lowercased message,
+        # which avoids per-character case folding inside the regex engine.
+        lowered = {
+            sev: [(pat, _lowercase_pattern(pat)) for pat in pats]
+            for sev, pats in self.severity_patterns.items()
+        }
+        # Patterns without metacharacters are plain substring tests and skip
+        # the regex engine entirely (stored with a None regex).
+        self._compiled_patterns: Dict[
+            str, List[Tuple[str, str, Optional[Pattern[str]]]]
+        ] = {
+            sev: [
+                (pat, low, None if re.escape(low) == low else re.compile(low))
+                for pat, low in pairs
+            ]
+            for sev, pairs in lowered.items()
+        }
+        self._fused_patterns: Dict[str, Pattern[str]] = {
+            sev: re.compile("|".join(f"(?:{low})" for _, low in pairs))
+            for sev, pairs in lowered.items()
+        }
+
+        # Flattened keyword view: declaration order for reporting and the
+        # combined weight of each keyword for scoring.
+        self._keyword_order: List[str] = [
+            kw for kws in self.severity_keywords.values() for kw in kws
+        ]
+        self._keyword_weight: Dict[str, int] = {}
+        for sev, kws in self.severity_keywords.items():
+            for kw in kws:
+                self._keyword_weight[kw] = (
+                    self._keyword_weight.get(kw, 0) + self._keyword_weights[sev]
+                )
+        self._keyword_automaton = self._build_keyword_automaton()
+
+        # Pure-Python fallback: a single lookahead alternation (longest first)
+        # finds the longest keyword starting at each position; every shorter
+        # keyword starting there is one of its prefixes.
+        by_length = sorted(self._keyword_weight, key=len, reverse=True)
+        self._keyword_regex: Pattern[str] = re.compile(
+            "(?=(" + "|".join(re.escape(kw) for kw in by_length) + "))"
+        )
+        self._keyword_prefixes: Dict[str, Tuple[str, ...]] = {
+            kw: tuple(other for other in by_length if kw.startswith(other))
+            for kw in by_length
+        }
+
+        # Analysis is a pure function of the message, so repeated calls with
+        # the same error (e.g. CLI retry loops) are served from a bounded memo.
+        self._analyze_cached = functools.lru_cache(maxsize=self.CACHE_SIZE)(
+            self._analyze
+        )
+        self._details_cached = functools.lru_cache(maxsize=self.CACHE_SIZE)(
+            self._severity_details
+        )
+        # Raw pattern/keyword hits are shared by scoring and by the details
+        # report, so a details call after analyze() does not rescan.
+        self._pattern_hits = functools.lru_cache(maxsize=self.CACHE_SIZE)(
+            self._match_patterns
+        )
+        self._keyword_hits = functools.lru_cache(maxsize=self.CACHE_SIZE)(
+            self._match_keywords
+        )
+
     # -------------------------
     # Public API
     # -------------------------
@@ -130,26 +264,23 @@ class SeverityAnalyzer:
         Returns:
             Severity level: 'mild', 'medium', or 'severe'
         """
-        if not error_message:
-            return "mild"
+        return self._analyze_cached(error_message)
 
-        msg_lower = error_message.lower()
-
-        pattern_score, top_pattern = self._score_patterns(error_message)
+    def analyze_many(self, error_messages: Iterable[str]) -> List[str]:
+        """
+        Analyze several error messages at once.
 
-        # Pattern priority short-circuits (preserve original behavior)
-        if top_pattern == "severe" and pattern_score >= 5:
-            return "severe"
-        if top_pattern == "mild" and pattern_score <= 2:
-            return "mild"
+        Each distinct message is scored only once, however often it repeats.
 
-        total = 0.0
-        total += pattern_score
-        total += self._score_keywords(msg_lower)
-        total += self._score_exclamations(error_message)
-        total += self._score_uppercase(error_message)
+        Args:
+            error_messages: The error messages to analyze
 
-        return self._score_to_severity(total)
+        Returns:
+            Severity levels in the same order as the input
+        """
+        messages = list(error_messages)
+        severities = {msg: self.analyze(msg) for msg in dict.fromkeys(messages)}
+        return [severities[msg] for msg in messages]
 
     def get_severity_details(self, error_message: str) -> Dict[str, Any]:
         """
@@ -161,67 +292,108 @@ class SeverityAnalyzer:
         Returns:
             Dictionary with severity details
         """
-        severity = self.analyze(error_message)
-        msg_lower = error_message.lower()
+        details = self._details_cached(error_message)
+        return {
+            **details,
+            "found_keywords": list(details["found_keywords"]),
+            "found_patterns": list(details["found_patterns"]),
+        }
 
-        found_keywords = self._find_keywords(msg_lower)
-        found_patterns = self._find_patterns(error_message)
+    # -------------------------
+    # Internal helpers
+    # -------------------------
 
-        uppercase_ratio = sum(1 for c in error_message if c.isupper()) / max(
-            len(error_message), 1
-        )
+    def _analyze(self, error_message: str) -> str:
+        if not error_message:
+            return "mild"
+
+        prepared = _prepare(error_message)
+
+        # Any severe pattern hit makes "severe" the top pattern with a score of
+        # at least 5, so one fused scan settles the common severe case before
+        # the remaining patterns, keywords and casing are looked at.
+        severe = self._fused_patterns.get("severe")
+        if severe is not None and severe.search(prepared.lower):
+            return "severe"
+
+        pattern_score, top_pattern = self._score_patterns(prepared.lower)
+
+        # Pattern priority short-circuits (preserve original behavior)
+        if top_pattern == "mild" and pattern_score <= 2:
+            return "mild"
+
+        total = 0.0
+        total += pattern_score
+        total += self._score_keywords(prepared.lower)
+        total += self._score_exclamations(prepared)
+        total += self._score_uppercase(prepared)
+
+        return self._score_to_severity(total)
+
+    def _severity_details(self, error_message: str) -> Dict[str, Any]:
+        severity = self.analyze(error_message)
+        prepared = _prepare(error_message)
+
+        # Stored as tuples so the memoized copy cannot be mutated by callers
+        found_keywords = tuple(self._find_keywords(prepared.lower))
+        found_patterns = tuple(self._find_patterns(prepared.lower))
 
         return {
             "severity": severity,
             "found_keywords": found_keywords,
             "found_patterns": found_patterns,
-            "exclamation_count": error_message.count("!"),
-            "uppercase_ratio": uppercase_ratio,
-            "message_length": len(error_message),
+            "exclamation_count": prepared.exclamations,
+            "uppercase_ratio": prepared.uppercase / max(len(prepared.raw), 1),
+            "message_length": len(prepared.raw),
         }
 
-    # -------------------------
-    # Internal helpers
-    # -------------------------
+    def _match_patterns(self, msg_lower: str) -> Tuple[Tuple[str, str], ...]:
+        hits: List[Tuple[str, str]] = []
+        for sev, compiled in self._compiled_patterns.items():
+            if not self._fused_patterns[sev].search(msg_lower):
+                continue
+            for pat, literal, regex in compiled:
+                if regex is None:
+                    if literal in msg_lower:
+                        hits.append((sev, pat))
+                elif regex.search(msg_lower):
+                    hits.append((sev, pat))
+        return tuple(hits)
 
-    def _score_patterns(self, message: str) -> Tuple[int, str | None]:
-        hits: List[Tuple[str, str]] = [
-            (sev, pat)
-            for sev, pats in self.severity_patterns.items()
-            for pat in pats
-            if re.search(pat, message, re.IGNORECASE)
-        ]
+    def _score_patterns(self, msg_lower: str) -> Tuple[int, str | None]:
+        hits = self._pattern_hits(msg_lower)
         score = sum(self._pattern_weights[sev] for sev, _ in hits)
         top = self._pick_top_severity(sev for sev, _ in hits)
         return score, top
 
+    def _build_keyword_automaton(self) -> Optional[Any]:
+        if ahocorasick is None or not self._keyword_weight:
+            return None
+        automaton = ahocorasick.Automaton()
+        for kw in self._keyword_weight:
+            automaton.add_word(kw, kw)
+        automaton.make_automaton()
+        return automaton
+
+    def _match_keywords(self, msg_lower: str) -> FrozenSet[str]:
+        if self._keyword_automaton is not None:
+            return frozenset(kw for _, kw in self._keyword_automaton.iter(msg_lower))
+        found: Set[str] = set()
+        for match in self._keyword_regex.finditer(msg_lower):
+            found.update(self._keyword_prefixes[match.group(1)])
+        return frozenset(found)
+
     def _score_keywords(self, msg_lower: str) -> int:
-        return sum(
-            self._keyword_weights[sev]
-            for sev, kws in self.severity_keywords.items()
-            for kw in kws
-            if kw in msg_lower
-        )
+        return sum(self._keyword_weight[kw] for kw in self._keyword_hits(msg_lower))
 
     @staticmethod
-    def _score_exclamations(message: str) -> int:
-        n = message.count("!")
-        if n >= 3:
-            return 3
-        if n == 2:
-            return 2
-        if n == 1:
-            return 1
-        return 0
-
-    def _score_uppercase(self, message: str) -> float:
-        words = message.split()
-        uppercase_words = [
-            w
-            for w in words
-            if w.isupper() and len(w) > 2 and w not in self._uppercase_exclusions
-        ]
-        return len(uppercase_words) * 0.5
+    def _score_exclamations(prepared: _PreparedMessage) -> int:
+        # One point per exclamation mark, capped at three
+        return min(prepared.exclamations, 3)
+
+    def _score_uppercase(self, prepared: _PreparedMessage) -> float:
+        exclusions = self._uppercase_exclusions
+        return sum(1 for w in prepared.shouted if w not in exclusions) * 0.5
 
     @staticmethod
     def _score_to_severity(score: float) -> str:
@@ -232,20 +404,11 @@ class SeverityAnalyzer:
         return "mild"
 
     def _find_keywords(self, msg_lower: str) -> List[str]:
-        return [
-            kw
-            for kws in self.severity_keywords.values()
-            for kw in kws
-            if kw in msg_lower
-        ]
+        found = self._keyword_hits(msg_lower)
+        return [kw for kw in self._keyword_order if kw in found]
 
-    def _find_patterns(self, message: str) -> List[str]:
-        return [
-            pat
-            for pats in self.severity_patterns.values()
-            for pat in pats
-            if re.search(pat, message, re.IGNORECASE)
-        ]
+    def _find_patterns(self, msg_lower: str) -> List[str]:
+        return [pat for _, pat in self._pattern_hits(msg_lower)]
 
     @staticmethod
     def _pick_top_severity(levels: Iterable[str]) -> str | None:
@@ -2,13 +2,35 @@
 Command-line interface for CosmicExcuse.
 """
 
+from __future__ import annotations
+
 import argparse
-import json
+import os
+import socket
+import stat
 import sys
-from typing import Any, List, Optional
-
-from cosmicexcuse import CosmicExcuse, __version__
-from cosmicexcuse.exceptions import CosmicExcuseError
+from types import SimpleNamespace
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    cast,
+)
+
+from cosmicexcuse.__version__ import __version__
+
+# Seconds the resident server waits on one client before dropping it
+CLIENT_TIMEOUT = 5.0
+
+# The generator stack and the JSON codec are imported inside the functions
+# that need them, so --help, --version and argument errors return without
+# loading either.
+if TYPE_CHECKING:
+    from cosmicexcuse.generator import CosmicExcuse
 
 
 def print_banner() -> None:
@@ -34,6 +56,8 @@ Examples:
   cosmicexcuse --haiku                   # Generate haiku excuse
   cosmicexcuse -l bn -c 3                # Generate 3 Bengali excuses
   cosmicexcuse --category quantum        # Generate quantum-specific excuse
+  cosmicexcuse --serve --socket /tmp/ce.sock   # Keep a generator resident
+  cosmicexcuse --socket /tmp/ce.sock -e "oops" # Ask the resident generator
         """,
     )
 
@@ -90,20 +114,45 @@ Examples:
         help="Minimum quality score (regenerate until met)",
     )
 
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Run as a resident server on --socket, reusing loaded generators",
+    )
+
+    parser.add_argument(
+        "--socket",
+        type=str,
+        default=None,
+        help="Unix socket path for --serve, or of a running server to query",
+    )
+
     return parser
 
 
+def write_json(obj: Any, indent: bool = False) -> None:
+    """Write an object to stdout as JSON followed by a newline in one write."""
+    from cosmicexcuse._json import dumpb, dumps
+
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        # stdout replaced by a text-only stream (e.g. io.StringIO)
+        sys.stdout.write(dumps(obj, indent=indent) + "\n")
+        return
+    sys.stdout.flush()
+    buffer.write(dumpb(obj, indent=indent) + b"\n")
+    buffer.flush()
+
+
 def handle_haiku(
     generator: CosmicExcuse, *, error: str, language: str, as_json: bool
 ) -> int:
     """Generate and print a haiku excuse."""
     haiku = generator.generate_haiku(error)
     if as_json:
-        print(json.dumps({"haiku": haiku, "language": language}))
+        write_json({"haiku": haiku, "language": language})
     else:
-        print("\n🎋 Haiku Excuse:\n")
-        print(haiku)
-        print()
+        print_haiku_text(haiku)
     return 0
 
 
@@ -121,62 +170,338 @@ def generate_excuses(
 
     Returns a list of excuse objects as produced by CosmicExcuse.generate().
     """
-    excuses: List[Any] = []
+    if min_score <= 0:
+        # Every excuse passes, so generate the whole batch in one pass
+        return generator.generate_many(
+            count, error_message=error, category=category, save_history=False
+        )
 
-    for _ in range(count):
-        attempts = 0
-        last_excuse = None
+    # Oversample in batches and filter instead of rejecting one excuse at a
+    # time; max_attempts still caps the total work at count * max_attempts.
+    excuses: List[Any] = []
+    rejected: List[Any] = []
+    budget = count * max_attempts
+    generated = 0
+    while len(excuses) < count and generated < budget:
+        shortfall = count - len(excuses)
+        if excuses:
+            # Size the next batch from the acceptance rate seen so far
+            batch_size = shortfall * generated // len(excuses) + 1
+        else:
+            batch_size = shortfall * 2
+        batch_size = min(batch_size, budget - generated)
+        generated += batch_size
 
-        while attempts < max_attempts:
-            excuse = generator.generate(error_message=error, category=category)
-            last_excuse = excuse
+        for excuse in generator.generate_many(
+            batch_size, error_message=error, category=category, save_history=False
+        ):
             if excuse.quality_score >= min_score:
                 excuses.append(excuse)
-                break
-            attempts += 1
+            else:
+                rejected.append(excuse)
 
-        if attempts >= max_attempts and last_excuse is not None:
-            # Use the last generated excuse even if below threshold
-            excuses.append(last_excuse)
+    # Use the latest excuses below the threshold if the cap was reached
+    shortfall = count - len(excuses)
+    if shortfall > 0:
+        excuses.extend(rejected[-shortfall:])
 
-    return excuses
+    return excuses[:count]
 
 
 def print_excuses_json(excuses: List[Any]) -> None:
     """Print excuses as a JSON list."""
-    output = []
-    for excuse in excuses:
-        output.append(
-            {
-                "text": excuse.text,
-                "recommendation": excuse.recommendation,
-                "severity": excuse.severity,
-                "category": excuse.category,
-                "quality_score": excuse.quality_score,
-                "language": excuse.language,
-            }
-        )
-    print(json.dumps(output, indent=2, ensure_ascii=False))
+    output = [excuse_to_dict(excuse) for excuse in excuses]
+    write_json(output, indent=True)
 
 
 def print_excuses_text(excuses: List[Any], *, count: int, show_score: bool) -> None:
     """Print excuses in a human-friendly format."""
+    # Collect every line and emit them with a single write
+    lines: List[str] = []
     for i, excuse in enumerate(excuses, 1):
         if count > 1:
-            print(f"\n{'=' * 50}")
-            print(f"Excuse #{i}")
-            print("=" * 50)
+            lines.append(f"\n{'=' * 50}")
+            lines.append(f"Excuse #{i}")
+            lines.append("=" * 50)
 
-        print(f"\n💫 Excuse: {excuse.text}")
-        print(f"\n💡 Recommendation: {excuse.recommendation}")
+        lines.append(f"\n💫 Excuse: {excuse.text}")
+        lines.append(f"\n💡 Recommendation: {excuse.recommendation}")
 
         if show_score:
-            print(f"\n📊 Quality Score: {excuse.quality_score}/100")
-            print(f"⚠️  Severity: {excuse.severity}")
-            print(f"📁 Category: {excuse.category}")
+            lines.append(f"\n📊 Quality Score: {excuse.quality_score}/100")
+            lines.append(f"⚠️  Severity: {excuse.severity}")
+            lines.append(f"📁 Category: {excuse.category}")
 
         if i < len(excuses):
-            print()
+            lines.append("")
+
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def print_haiku_text(haiku: str) -> None:
+    """Print a haiku in a human-friendly format."""
+    sys.stdout.write(f"\n🎋 Haiku Excuse:\n\n{haiku}\n\n")
+
+
+def excuse_to_dict(excuse: Any) -> Dict[str, Any]:
+    """Convert an excuse object into the public JSON shape."""
+    return {
+        "text": excuse.text,
+        "recommendation": excuse.recommendation,
+        "severity": excuse.severity,
+        "category": excuse.category,
+        "quality_score": excuse.quality_score,
+        "language": excuse.language,
+    }
+
+
+def handle_request(
+    generators: Dict[str, CosmicExcuse], request: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Serve one resident-mode request using already constructed generators.
+
+    Args:
+        generators: Generators keyed by language, filled on first use
+        request: Decoded request with the same fields as the CLI options
+
+    Returns:
+        JSON-serializable response with either ``haiku`` or ``excuses``
+    """
+    from cosmicexcuse.generator import CosmicExcuse
+
+    language = request.get("language", "en")
+    generator = generators.get(language)
+    if generator is None:
+        generator = generators[language] = CosmicExcuse(language=language)
+
+    error = request.get("error", "")
+    if request.get("haiku"):
+        return {"haiku": generator.generate_haiku(error), "language": language}
+
+    excuses = generate_excuses(
+        generator,
+        error=error,
+        category=request.get("category"),
+        count=int(request.get("count", 1)),
+        min_score=int(request.get("min_score", 0)),
+    )
+    return {"excuses": [excuse_to_dict(excuse) for excuse in excuses]}
+
+
+def _read_message(conn: socket.socket) -> Dict[str, Any]:
+    """Read one newline-terminated JSON message from a socket."""
+    from cosmicexcuse._json import loads
+
+    chunks = []
+    while True:
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        if chunk.endswith(b"\n"):
+            break
+    return cast(Dict[str, Any], loads(b"".join(chunks)))
+
+
+def _send_message(conn: socket.socket, message: Dict[str, Any]) -> None:
+    """Write one newline-terminated JSON message to a socket."""
+    from cosmicexcuse._json import dumpb
+
+    conn.sendall(dumpb(message) + b"\n")
+
+
+def _serve_connection(conn: socket.socket, generators: Dict[str, CosmicExcuse]) -> None:
+    """
+    Answer one client of the resident server.
+
+    Socket errors (a stalled client timing out, or one that disconnects
+    early) only drop that client, so they never stop the server.
+    """
+    # One stalled client must not block the accept loop forever
+    conn.settimeout(CLIENT_TIMEOUT)
+    try:
+        try:
+            request = _read_message(conn)
+        except ValueError as e:
+            _send_message(conn, {"error": str(e)})
+            return
+
+        try:
+            response = handle_request(generators, request)
+        except Exception as e:
+            response = {"error": str(e)}
+        _send_message(conn, response)
+    except OSError:
+        pass
+
+
+def serve(socket_path: str) -> int:
+    """
+    Run a resident excuse server on a Unix socket.
+
+    Generators (and their analyzer caches) are built once per language and
+    reused for every request, so clients skip import and construction cost.
+
+    Args:
+        socket_path: Filesystem path of the Unix socket to listen on
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        print("Error: --serve requires Unix domain sockets", file=sys.stderr)
+        return 1
+
+    # Replace a stale socket from an earlier server, but never anything else
+    # that happens to live at the path
+    try:
+        if not stat.S_ISSOCK(os.lstat(socket_path).st_mode):
+            print(f"Error: {socket_path} exists and is not a socket", file=sys.stderr)
+            return 1
+        os.unlink(socket_path)
+    except FileNotFoundError:
+        pass
+
+    generators: Dict[str, CosmicExcuse] = {}
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    bound = False
+    try:
+        server.bind(socket_path)
+        bound = True
+        server.listen()
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                _serve_connection(conn, generators)
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        server.close()
+        # Only remove the socket this server created
+        if bound and os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+def _client_submit(
+    socket_path: str, request: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """
+    Forward a request to a resident server.
+
+    Returns:
+        The decoded response, or None if no server is reachable
+    """
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(socket_path):
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(socket_path)
+            _send_message(client, request)
+            return _read_message(client)
+    except (OSError, ValueError):
+        return None
+
+
+def print_response(response: Dict[str, Any], args: argparse.Namespace) -> int:
+    """Print a resident-server response exactly like a local run would."""
+    if "error" in response:
+        print(f"Error: {response['error']}", file=sys.stderr)
+        return 1
+
+    if "haiku" in response:
+        if args.json:
+            write_json(response)
+        else:
+            print_haiku_text(response["haiku"])
+        return 0
+
+    if args.json:
+        # The server already sent the public JSON shape; write it through as-is
+        write_json(response["excuses"], indent=True)
+    else:
+        excuses = [SimpleNamespace(**excuse) for excuse in response["excuses"]]
+        print_excuses_text(excuses, count=args.count, show_score=bool(args.show_score))
+    return 0
+
+
+def run_resident(
+    parser: argparse.ArgumentParser, args: argparse.Namespace
+) -> Optional[int]:
+    """
+    Handle --serve and --socket.
+
+    Returns:
+        An exit code, or None when the request should be generated locally
+        (no socket given or no server listening on it)
+    """
+    if args.serve:
+        if not args.socket:
+            parser.error("--serve requires --socket PATH")
+        print(f"Serving excuses on {args.socket} (Ctrl+C to stop)", flush=True)
+        return serve(args.socket)
+
+    if not args.socket:
+        return None
+
+    response = _client_submit(
+        args.socket,
+        {
+            "error": args.error,
+            "language": args.language,
+            "category": args.category,
+            "count": args.count,
+            "min_score": args.min_score,
+            "haiku": bool(args.haiku),
+        },
+    )
+    if response is None:
+        return None
+    return print_response(response, args)
+
+
+def _run_haiku_json(generator: CosmicExcuse, args: argparse.Namespace) -> int:
+    return handle_haiku(
+        generator, error=args.error, language=args.language, as_json=True
+    )
+
+
+def _run_haiku_text(generator: CosmicExcuse, args: argparse.Namespace) -> int:
+    return handle_haiku(
+        generator, error=args.error, language=args.language, as_json=False
+    )
+
+
+def _generate_for_args(generator: CosmicExcuse, args: argparse.Namespace) -> List[Any]:
+    return generate_excuses(
+        generator,
+        error=args.error,
+        category=args.category,
+        count=args.count,
+        min_score=args.min_score,
+    )
+
+
+def _run_excuses_json(generator: CosmicExcuse, args: argparse.Namespace) -> int:
+    print_excuses_json(_generate_for_args(generator, args))
+    return 0
+
+
+def _run_excuses_text(generator: CosmicExcuse, args: argparse.Namespace) -> int:
+    print_excuses_text(
+        _generate_for_args(generator, args),
+        count=args.count,
+        show_score=bool(args.show_score),
+    )
+    return 0
+
+
+# (mode, output format) -> runner
+MODES: Dict[Tuple[str, str], Callable[[CosmicExcuse, argparse.Namespace], int]] = {
+    ("haiku", "json"): _run_haiku_json,
+    ("haiku", "text"): _run_haiku_text,
+    ("excuses", "json"): _run_excuses_json,
+    ("excuses", "text"): _run_excuses_text,
+}
 
 
 def main(argv: Optional[list] = None) -> int:
@@ -193,37 +518,20 @@ def main(argv: Optional[list] = None) -> int:
     if not args.no_banner and not args.json:
         print_banner()
 
-    try:
-        # Initialize generator
-        generator = CosmicExcuse(language=args.language)
-
-        # Haiku path
-        if args.haiku:
-            return handle_haiku(
-                generator,
-                error=args.error,
-                language=args.language,
-                as_json=bool(args.json),
-            )
-
-        # Regular excuses
-        excuses = generate_excuses(
-            generator,
-            error=args.error,
-            category=args.category,
-            count=args.count,
-            min_score=args.min_score,
-        )
+    resident_exit = run_resident(parser, args)
+    if resident_exit is not None:
+        return resident_exit
 
-        # Output
-        if args.json:
-            print_excuses_json(excuses)
-        else:
-            print_excuses_text(
-                excuses, count=args.count, show_score=bool(args.show_score)
-            )
+    from cosmicexcuse.exceptions import CosmicExcuseError
+    from cosmicexcuse.generator import get_cached_generator
 
-        return 0
+    try:
+        # Reuse the generator for this language across in-process calls
+        generator = get_cached_generator(args.language)
+
+        mode = "haiku" if args.haiku else "excuses"
+        output = "json" if args.json else "text"
+        return MODES[mode, output](generator, args)
 
     except CosmicExcuseError as e:
         print(f"Error: {e}", file=sys.stderr)
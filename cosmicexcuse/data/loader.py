@@ -2,19 +2,78 @@
 Data loader module for loading JSON excuse data.
 """
 
-import json
+import functools
 import warnings
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from cosmicexcuse._json import JSONDecodeError, loads
 from cosmicexcuse.exceptions import DataLoadError, LanguageNotSupportedError
 
+# Data files every language directory is expected to provide
+CATEGORIES = (
+    "quantum",
+    "cosmic",
+    "ai",
+    "technical",
+    "blame",
+    "recommendations",
+    "connectors",
+    "intensifiers",
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _read_json(path: str, mtime_ns: int) -> Any:
+    """
+    Parse a JSON file, memoized per path and modification time.
+
+    Parsed data is shared by every loader reading the same unchanged file,
+    so it must never be handed out directly; see ``_copy_data``.
+    """
+    return loads(Path(path).read_bytes())
+
+
+def _copy_data(data: Any) -> Any:
+    """Return a copy of parsed JSON data with fresh lists and dicts."""
+    if isinstance(data, list):
+        return [_copy_data(item) for item in data]
+    if isinstance(data, dict):
+        return {key: _copy_data(value) for key, value in data.items()}
+    return data
+
+
+@functools.lru_cache(maxsize=8)
+def _discover_languages(data_root: str) -> Tuple[str, ...]:
+    """Scan a data root once for language directories."""
+    return tuple(
+        path.name
+        for path in Path(data_root).iterdir()
+        if path.is_dir() and not path.name.startswith("_")
+    )
+
 
 class DataLoader:
     """
     Loads excuse data from JSON files.
     """
 
+    # Shared, read-only fallbacks used when a category file fails to parse
+    _FALLBACKS: Dict[str, Any] = {
+        "quantum": ["quantum interference"],
+        "cosmic": ["cosmic ray interference"],
+        "ai": ["AI malfunction"],
+        "technical": ["technical difficulties"],
+        "blame": ["unexpected behavior"],
+        "recommendations": ["Try again later"],
+        "connectors": ["which caused", "resulting in"],
+        "intensifiers": {
+            "mild": ["slightly"],
+            "medium": ["definitely"],
+            "severe": ["catastrophically"],
+        },
+    }
+
     def __init__(self, language: str = "en", data_path: Optional[Path] = None):
         """
         Initialize data loader.
@@ -51,45 +110,33 @@ class DataLoader:
         """
         file_path = self.data_path / f"{filename}.json"
 
-        if not file_path.exists():
-            warnings.warn(f"Data file {file_path} not found, using empty data")
-            return {}
-
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            # Copy the cached parse so one loader's edits stay its own
+            data = _copy_data(_read_json(str(file_path), file_path.stat().st_mtime_ns))
 
             # Extract the excuses list if it exists
             if "excuses" in data:
                 return data["excuses"]
             return data
 
-        except json.JSONDecodeError as e:
+        except FileNotFoundError:
+            warnings.warn(f"Data file {file_path} not found, using empty data")
+            return {}
+        except JSONDecodeError as e:
             raise DataLoadError(f"Failed to parse JSON from {file_path}: {e}")
         except Exception as e:
             raise DataLoadError(f"Failed to load {file_path}: {e}")
 
-    def load_all(self) -> Dict[str, List[str]]:
+    def load_all(self) -> Dict[str, Any]:
         """
         Load all excuse data files for the language.
 
         Returns:
             Dictionary mapping category names to lists of excuses
         """
-        categories = [
-            "quantum",
-            "cosmic",
-            "ai",
-            "technical",
-            "blame",
-            "recommendations",
-            "connectors",
-            "intensifiers",
-        ]
-
-        data = {}
-
-        for category in categories:
+        data: Dict[str, Any] = {}
+
+        for category in CATEGORIES:
             try:
                 loaded_data = self.load_file(category)
                 if loaded_data:
@@ -111,22 +158,8 @@ class DataLoader:
         Returns:
             List of fallback excuses
         """
-        fallbacks = {
-            "quantum": ["quantum interference"],
-            "cosmic": ["cosmic ray interference"],
-            "ai": ["AI malfunction"],
-            "technical": ["technical difficulties"],
-            "blame": ["unexpected behavior"],
-            "recommendations": ["Try again later"],
-            "connectors": ["which caused", "resulting in"],
-            "intensifiers": {
-                "mild": ["slightly"],
-                "medium": ["definitely"],
-                "severe": ["catastrophically"],
-            },
-        }
-
-        return fallbacks.get(category, ["unknown error"])
+        fallback: List[str] = self._FALLBACKS.get(category, ["unknown error"])
+        return fallback
 
     def get_available_languages(self) -> List[str]:
         """
@@ -135,14 +168,7 @@ class DataLoader:
         Returns:
             List of language codes
         """
-        data_root = self.data_path.parent
-        languages = []
-
-        for path in data_root.iterdir():
-            if path.is_dir() and not path.name.startswith("_"):
-                languages.append(path.name)
-
-        return languages
+        return list(_discover_languages(str(self.data_path.parent)))
 
     def validate_data(self) -> Dict[str, bool]:
         """
@@ -151,29 +177,13 @@ class DataLoader:
         Returns:
             Dictionary mapping category names to validation status
         """
-        categories = [
-            "quantum",
-            "cosmic",
-            "ai",
-            "technical",
-            "blame",
-            "recommendations",
-            "connectors",
-            "intensifiers",
-        ]
-
         validation = {}
 
-        for category in categories:
+        for category in CATEGORIES:
             file_path = self.data_path / f"{category}.json"
 
-            if not file_path.exists():
-                validation[category] = False
-                continue
-
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                data = loads(file_path.read_bytes())
 
                 # Check if data has expected structure
                 if "excuses" in data and isinstance(data["excuses"], list):
@@ -185,6 +195,8 @@ class DataLoader:
                 else:
                     validation[category] = False
 
+            except FileNotFoundError:
+                validation[category] = False
             except Exception as e:
                 print(str(e))
                 validation[category] = False
@@ -2,15 +2,20 @@
 Excuse formatting module for different output formats.
 """
 
+import functools
 import random
 import textwrap
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 
+from cosmicexcuse._json import dumps
+
 
 class BaseFormatter(ABC):
     """Abstract base class for formatters."""
 
+    __slots__ = ()
+
     @abstractmethod
     def format(self, data: Dict[str, Any]) -> str:
         """Format the data into a string."""
@@ -22,6 +27,8 @@ class ExcuseFormatter(BaseFormatter):
     Standard excuse formatter.
     """
 
+    __slots__ = ("max_length", "_rng", "_corporate_templates")
+
     def __init__(self, max_length: Optional[int] = None):
         """
         Initialize the formatter.
@@ -30,6 +37,15 @@ class ExcuseFormatter(BaseFormatter):
             max_length: Optional maximum length for the excuse
         """
         self.max_length = max_length
+        # Private RNG so formatters do not share the module-level random state;
+        # seed it via formatter._rng.seed(x) for reproducible output
+        self._rng = random.Random()
+        self._corporate_templates = (
+            "We are currently experiencing {issue}. Our team is actively working on a resolution. {action}",
+            "Due to {issue}, some users may experience degraded performance. {action}",
+            "An unexpected {issue} has been identified. {action}",
+            "We've detected {issue} affecting system stability. {action}",
+        )
 
     def format(self, data: Dict[str, Any]) -> str:
         """
@@ -68,22 +84,18 @@ class ExcuseFormatter(BaseFormatter):
         Returns:
             Formatted excuse string
         """
-        # Build the excuse
-        excuse_parts = []
-
-        # Main clause
-        excuse_parts.append(f"The error was {intensifier} caused by {primary_excuse}")
-
-        # Secondary clause
-        excuse_parts.append(f"{connector} {secondary_excuse}")
-
-        # Technical analysis
-        if markov_phrase:
-            excuse_parts.append(
-                f"Additionally, analysis shows {markov_phrase} instability"
-            )
-
-        excuse = ". ".join(excuse_parts) + "."
+        # Technical analysis, only when the chain produced a phrase
+        analysis = (
+            f". Additionally, analysis shows {markov_phrase} instability"
+            if markov_phrase
+            else ""
+        )
+
+        # Main clause, secondary clause and analysis in one f-string
+        excuse = (
+            f"The error was {intensifier} caused by {primary_excuse}. "
+            f"{connector} {secondary_excuse}{analysis}."
+        )
 
         # Apply length limit if specified
         if self.max_length and len(excuse) > self.max_length:
@@ -122,15 +134,50 @@ class ExcuseFormatter(BaseFormatter):
         Returns:
             Corporate-formatted excuse
         """
-        templates = [
-            "We are currently experiencing {issue}. Our team is actively working on a resolution. {action}",
-            "Due to {issue}, some users may experience degraded performance. {action}",
-            "An unexpected {issue} has been identified. {action}",
-            "We've detected {issue} affecting system stability. {action}",
+        return self.format_corporate_batch([primary_excuse], [recommendation])[0]
+
+    def format_corporate_batch(
+        self, primary_excuses: List[str], recommendations: List[str]
+    ) -> List[str]:
+        """
+        Format several excuses in corporate speak.
+
+        Args:
+            primary_excuses: Main excuses
+            recommendations: Recommended actions, paired with primary_excuses
+
+        Returns:
+            Corporate-formatted excuses
+
+        Raises:
+            ValueError: If the two lists differ in length
+        """
+        # zip(strict=True) needs Python 3.10
+        if len(primary_excuses) != len(recommendations):
+            raise ValueError(
+                f"Got {len(primary_excuses)} excuses but "
+                f"{len(recommendations)} recommendations"
+            )
+
+        templates = self._rng.choices(self._corporate_templates, k=len(primary_excuses))
+        return [
+            template.format(issue=issue, action=action)
+            for template, issue, action in zip(
+                templates, primary_excuses, recommendations
+            )
         ]
 
-        template = random.choice(templates)
-        return template.format(issue=primary_excuse, action=recommendation)
+
+@functools.lru_cache(maxsize=1024)
+def _first_words(text: str, count: int) -> str:
+    """
+    Return the first ``count`` words of text, joined by single spaces.
+
+    Haiku lines are drawn from a fixed pool of data strings, so the result
+    is memoized and repeated picks become a cache lookup.
+    """
+    # Split off only the words we keep instead of the whole text
+    return " ".join(text.split(None, count)[:count])
 
 
 class HaikuFormatter(BaseFormatter):
@@ -138,8 +185,12 @@ class HaikuFormatter(BaseFormatter):
     Format excuses as haikus.
     """
 
+    __slots__ = ("_rng", "syllable_5_templates", "syllable_7_templates")
+
     def __init__(self):
         """Initialize haiku formatter."""
+        # Private RNG; seed via formatter._rng.seed(x) for reproducible output
+        self._rng = random.Random()
         self.syllable_5_templates = [
             "{excuse_short}",
             "Bits flip in the void",
@@ -192,13 +243,21 @@ class HaikuFormatter(BaseFormatter):
             line3 = self._truncate_to_syllables(components.get("line_5_2", ""), 5)
         else:
             # Generate from templates
-            line1 = random.choice(self.syllable_5_templates)
-            line2 = random.choice(self.syllable_7_templates)
-            line3 = random.choice(self.syllable_5_templates)
-
-            # Ensure we don't repeat lines
-            while line3 == line1:
-                line3 = random.choice(self.syllable_5_templates)
+            templates_5 = self.syllable_5_templates
+            first = self._rng.randrange(len(templates_5))
+            line2 = self._rng.choice(self.syllable_7_templates)
+
+            # Pick a different closing line without rerolling: draw from the
+            # remaining indices and skip over the first pick
+            if len(templates_5) > 1:
+                last = self._rng.randrange(len(templates_5) - 1)
+                if last >= first:
+                    last += 1
+            else:
+                last = first
+
+            line1 = templates_5[first]
+            line3 = templates_5[last]
 
         return f"{line1}\n{line2}\n{line3}"
 
@@ -214,9 +273,12 @@ class HaikuFormatter(BaseFormatter):
             Truncated text
         """
         # Simplified: assume ~1.3 syllables per word on average
-        words = text.split()
         target_words = max(1, int(syllables / 1.3))
-        return " ".join(words[:target_words])
+        return _first_words(text, target_words)
+
+
+# Severity markers used by MarkdownFormatter
+SEVERITY_EMOJI = {"mild": "🟢", "medium": "🟡", "severe": "🔴"}
 
 
 class MarkdownFormatter(BaseFormatter):
@@ -224,6 +286,8 @@ class MarkdownFormatter(BaseFormatter):
     Format excuses in Markdown.
     """
 
+    __slots__ = ()
+
     def format(self, data: Dict[str, Any]) -> str:
         """
         Format as Markdown.
@@ -247,8 +311,7 @@ class MarkdownFormatter(BaseFormatter):
         output.append("### 📊 Metadata\n")
 
         if "severity" in data:
-            severity_emoji = {"mild": "🟢", "medium": "🟡", "severe": "🔴"}
-            emoji = severity_emoji.get(data["severity"], "⚪")
+            emoji = SEVERITY_EMOJI.get(data["severity"], "⚪")
             output.append(f"- **Severity:** {emoji} {data['severity'].capitalize()}")
 
         if "category" in data:
@@ -265,12 +328,12 @@ class MarkdownFormatter(BaseFormatter):
         # Recommendation
         if "recommendation" in data:
             output.append("\n### 💡 Recommended Action\n")
-            output.append("> {data['recommendation']}")
+            output.append(f"> {data['recommendation']}")
 
         # Technical details
         if "metadata" in data and "markov_component" in data["metadata"]:
             output.append("\n### 🔬 Technical Analysis\n")
-            output.append("```\n{data['metadata']['markov_component']}\n```")
+            output.append(f"```\n{data['metadata']['markov_component']}\n```")
 
         return "\n".join(output)
 
@@ -280,6 +343,8 @@ class JSONFormatter(BaseFormatter):
     Format excuses as JSON.
     """
 
+    __slots__ = ()
+
     def format(self, data: Dict[str, Any]) -> str:
         """
         Format as JSON string.
@@ -290,8 +355,6 @@ class JSONFormatter(BaseFormatter):
         Returns:
             JSON-formatted string
         """
-        import json
-
         # Extract relevant fields
         output = {
             "excuse": data.get("text", ""),
@@ -309,7 +372,7 @@ class JSONFormatter(BaseFormatter):
             output["technical_details"] = data["metadata"].get("markov_component", "")
             output["error_message"] = data["metadata"].get("error_message", "")
 
-        return json.dumps(output, indent=2, ensure_ascii=False)
+        return dumps(output, indent=True)
 
 
 class PlainTextFormatter(BaseFormatter):
@@ -317,6 +380,8 @@ class PlainTextFormatter(BaseFormatter):
     Simple plain text formatter.
     """
 
+    __slots__ = ("width", "_wrapper")
+
     def __init__(self, width: int = 80):
         """
         Initialize plain text formatter.
@@ -325,6 +390,8 @@ class PlainTextFormatter(BaseFormatter):
             width: Line width for wrapping
         """
         self.width = width
+        # Reused across calls; textwrap.fill builds a new TextWrapper each time
+        self._wrapper = textwrap.TextWrapper(width=width, subsequent_indent="  ")
 
     def format(self, data: Dict[str, Any]) -> str:
         """
@@ -337,6 +404,8 @@ class PlainTextFormatter(BaseFormatter):
             Plain text string
         """
         lines = []
+        wrapper = self._wrapper
+        wrapper.width = self.width
 
         # Header
         lines.append("=" * self.width)
@@ -346,19 +415,13 @@ class PlainTextFormatter(BaseFormatter):
 
         # Main excuse
         if "text" in data:
-            wrapped = textwrap.fill(
-                f"EXCUSE: {data['text']}", width=self.width, subsequent_indent="  "
-            )
+            wrapped = wrapper.fill(f"EXCUSE: {data['text']}")
             lines.append(wrapped)
             lines.append("")
 
         # Recommendation
         if "recommendation" in data:
-            wrapped = textwrap.fill(
-                f"RECOMMENDATION: {data['recommendation']}",
-                width=self.width,
-                subsequent_indent="  ",
-            )
+            wrapped = wrapper.fill(f"RECOMMENDATION: {data['recommendation']}")
             lines.append(wrapped)
             lines.append("")
 
@@ -383,6 +446,11 @@ class TwitterFormatter(BaseFormatter):
     Format excuses for Twitter/X (character limit).
     """
 
+    __slots__ = ("max_chars",)
+
+    # Appended to every tweet
+    HASHTAGS = " #debugging #programming #excuses #quantum"
+
     def __init__(self, max_chars: int = 280):
         """
         Initialize Twitter formatter.
@@ -404,14 +472,10 @@ class TwitterFormatter(BaseFormatter):
         """
         text = data.get("text", "")
 
-        # Add hashtags
-        hashtags = " #debugging #programming #excuses #quantum"
-
-        # Calculate available space
-        available = self.max_chars - len(hashtags) - 3  # -3 for "..."
+        # Space left for the text, keeping room for "..."
+        available = self.max_chars - len(self.HASHTAGS) - 3
 
         if len(text) <= available:
-            return text + hashtags
-        else:
-            # Truncate and add ellipsis
-            return text[:available] + "..." + hashtags
+            return f"{text}{self.HASHTAGS}"
+        # Truncate and add ellipsis
+        return f"{text[:available]}...{self.HASHTAGS}"
@@ -2,15 +2,15 @@
 Main excuse generator module for CosmicExcuse.
 """
 
-import hashlib
-import itertools
+import functools
 import os
 import random
-import threading
 import time
+from collections import Counter
 from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
 
 from cosmicexcuse.analyzer import SeverityAnalyzer
 from cosmicexcuse.data.loader import DataLoader
@@ -25,6 +25,19 @@ class Excuse:
     Represents a generated excuse with metadata.
     """
 
+    # Declared by hand because dataclass(slots=True) needs Python 3.10
+    __slots__ = (
+        "text",
+        "recommendation",
+        "severity",
+        "category",
+        "quality_score",
+        "quantum_probability",
+        "language",
+        "timestamp",
+        "metadata",
+    )
+
     text: str
     recommendation: str
     severity: str
@@ -36,8 +49,54 @@ class Excuse:
     metadata: Dict[str, Any]
 
 
-# Monotonic counter to guarantee changing seeds across rapid calls
-_SEED_COUNTER = itertools.count()
+# Data categories that hold sentence glue rather than excuses
+_META_CATEGORIES = frozenset({"recommendations", "connectors", "intensifiers"})
+
+# Words that earn an excuse a quality-score bonus (matched lowercase)
+_BONUS_WORDS = ("quantum", "cosmic", "ai", "blockchain", "neural")
+
+# Sample error messages used by generate_batch for variety
+_SAMPLE_ERRORS = (
+    "FATAL ERROR: Everything is broken!",
+    "SegmentationFault: Core dumped",
+    "NullPointerException at line infinity",
+    "KeyError: 'success'",
+    "RuntimeError: Unknown error occurred",
+    "ValueError: Invalid value",
+    "TypeError: Type mismatch",
+    "MemoryError: Out of memory",
+)
+
+# Haiku line -> (data category, fallback lines if the category is missing)
+_HAIKU_SOURCES = {
+    "line_5_1": ("quantum", ("Quantum states collapse",)),
+    "line_7": ("cosmic", ("The cosmos interferes today",)),
+    "line_5_2": ("ai", ("AI has gone rogue",)),
+}
+
+# Source of quality-score seeds, kept apart from the module-level random state
+# so patching or seeding `random` does not affect it
+_SEED_RNG = random.Random()
+if hasattr(os, "register_at_fork"):
+    # Forked children would otherwise repeat the parent's seed sequence
+    os.register_at_fork(after_in_child=_SEED_RNG.seed)
+
+
+@functools.lru_cache(maxsize=8)
+def _trained_markov_chain(technical_terms: Tuple[str, ...]) -> MarkovChain:
+    """
+    Train a Markov chain on technical terms, memoized per term list.
+
+    The cached chain is a template: hand out copy() so callers that train
+    or reset their chain never affect other generators.
+    """
+    corpus: List[str] = []
+    for term in technical_terms:
+        corpus.extend(term.split())
+
+    markov = MarkovChain()
+    markov.train(corpus)
+    return markov
 
 
 class ExcuseGenerator:
@@ -47,9 +106,22 @@ class ExcuseGenerator:
 
     SUPPORTED_LANGUAGES = ["en", "bn"]
 
-    def __init__(self, language: str = "en", data_path: Optional[Path] = None):
+    def __init__(
+        self,
+        language: str = "en",
+        data_path: Optional[Path] = None,
+        rng: Optional[random.Random] = None,
+    ):
         """
         Initialize the excuse generator.
+
+        Args:
+            language: Language code ('en' or 'bn')
+            data_path: Optional custom data directory
+            rng: Optional random.Random used for component picks, for
+                reproducible excuses; defaults to the module-level random
+                functions, so random.seed() and patching them still apply.
+                Markov phrases come from the shared chain's own RNG.
         """
         if language not in self.SUPPORTED_LANGUAGES:
             raise LanguageNotSupportedError(
@@ -58,28 +130,40 @@ class ExcuseGenerator:
             )
 
         self.language = language
+        self._rng: Any = random if rng is None else rng
         self.data_loader = DataLoader(language, data_path)
         self.data = self.data_loader.load_all()
 
+        # Category pools are fixed once the data is known
+        self._primary_categories = tuple(
+            k for k in self.data if k not in _META_CATEGORIES
+        )
+        self._secondary_categories = {
+            k: tuple(c for c in self._primary_categories if c != k)
+            for k in self._primary_categories
+        }
+
         self.analyzer = SeverityAnalyzer()
-        self.markov = MarkovChain()
+        self.markov: MarkovChain
         self.formatter = ExcuseFormatter()
+        self.haiku_formatter = HaikuFormatter()
 
         # Build Markov chain from technical corpus
         self._build_markov_chain()
 
     def _build_markov_chain(self):
-        """Build Markov chain from technical terms."""
+        """
+        Build Markov chain from technical terms.
+
+        Training is memoized per term list; each generator gets its own
+        copy of the trained chain, so it may train or reset self.markov.
+        """
         technical_terms: List[str] = []
         for category in ["quantum", "technical", "ai"]:
             if category in self.data:
                 technical_terms.extend(self.data[category])
 
-        corpus: List[str] = []
-        for term in technical_terms:
-            corpus.extend(term.split())
-
-        self.markov.train(corpus)
+        self.markov = _trained_markov_chain(tuple(technical_terms)).copy()
 
     def generate(
         self,
@@ -92,41 +176,138 @@ class ExcuseGenerator:
         """
         severity = self.analyzer.analyze(error_message)
 
-        # High-entropy seed used only for scoring/metadata; do NOT reseed RNG
-        quantum_seed = self._generate_quantum_seed(error_message)
-
-        # Select categories using module-level random.choice (so tests can patch it)
-        if category and category in self.data:
+        if category in self._secondary_categories:
             primary_category = category
         else:
-            primary_category = random.choice(list(self.data.keys()))
-
-        # Ensure we don't pick recommendations or connectors as primary
-        while primary_category in ["recommendations", "connectors", "intensifiers"]:
-            primary_category = random.choice(list(self.data.keys()))
+            primary_category = self._rng.choice(self._primary_categories)
 
         # Get excuse components
-        primary_excuse = random.choice(self.data[primary_category])
+        primary_excuse = self._rng.choice(self.data[primary_category])
 
         # Get secondary category
-        available_categories = [
-            k
-            for k in self.data.keys()
-            if k
-            not in [primary_category, "recommendations", "connectors", "intensifiers"]
-        ]
-        secondary_category = random.choice(available_categories)
-        secondary_excuse = random.choice(self.data[secondary_category])
+        secondary_category = self._rng.choice(
+            self._secondary_categories[primary_category]
+        )
+        secondary_excuse = self._rng.choice(self.data[secondary_category])
 
         # Get intensifier based on severity
         intensifier = self._get_intensifier(severity)
 
         # Get connector
-        connector = random.choice(self.data.get("connectors", ["which caused"]))
+        connector = self._rng.choice(self._connectors)
 
         # Generate Markov nonsense
         markov_phrase = self.markov.generate(length=5)
 
+        # Get recommendation
+        recommendation = self._rng.choice(self._recommendations)
+
+        return self._build_excuse(
+            error_message=error_message,
+            context=context,
+            severity=severity,
+            primary_category=primary_category,
+            primary_excuse=primary_excuse,
+            secondary_category=secondary_category,
+            secondary_excuse=secondary_excuse,
+            intensifier=intensifier,
+            connector=connector,
+            markov_phrase=markov_phrase,
+            recommendation=recommendation,
+        )
+
+    def generate_many(
+        self,
+        count: int,
+        error_message: str = "",
+        context: Optional[str] = None,
+        category: Optional[str] = None,
+    ) -> List[Excuse]:
+        """
+        Generate several excuses for the same error in one pass.
+
+        Equivalent to calling generate() ``count`` times, but the severity,
+        the category pools and the random component picks are computed once
+        for the whole batch instead of once per excuse.
+
+        Args:
+            count: Number of excuses to generate
+            error_message: The error message to generate excuses for
+            context: Optional context stored in each excuse's metadata
+            category: Optional primary category
+
+        Returns:
+            List of generated excuses
+        """
+        if count <= 0:
+            return []
+
+        severity = self.analyzer.analyze(error_message)
+
+        if category in self._secondary_categories:
+            primary_categories = [category] * count
+        else:
+            primary_categories = self._rng.choices(self._primary_categories, k=count)
+
+        intensifiers = self._rng.choices(self._intensifier_pool(severity), k=count)
+        connectors = self._rng.choices(self._connectors, k=count)
+        recommendations = self._rng.choices(self._recommendations, k=count)
+        markov_phrases = self.markov.generate_many(count, length=5)
+
+        choice = self._rng.choice
+        excuses: List[Excuse] = []
+        for (
+            primary_category,
+            intensifier,
+            connector,
+            recommendation,
+            markov_phrase,
+        ) in zip(
+            primary_categories,
+            intensifiers,
+            connectors,
+            recommendations,
+            markov_phrases,
+        ):
+            secondary_category = choice(self._secondary_categories[primary_category])
+
+            excuses.append(
+                self._build_excuse(
+                    error_message=error_message,
+                    context=context,
+                    severity=severity,
+                    primary_category=primary_category,
+                    primary_excuse=choice(self.data[primary_category]),
+                    secondary_category=secondary_category,
+                    secondary_excuse=choice(self.data[secondary_category]),
+                    intensifier=intensifier,
+                    connector=connector,
+                    markov_phrase=markov_phrase,
+                    recommendation=recommendation,
+                )
+            )
+
+        return excuses
+
+    def _build_excuse(
+        self,
+        *,
+        error_message: str,
+        context: Optional[str],
+        severity: str,
+        primary_category: str,
+        primary_excuse: str,
+        secondary_category: str,
+        secondary_excuse: str,
+        intensifier: str,
+        connector: str,
+        markov_phrase: str,
+        recommendation: str,
+    ) -> Excuse:
+        """Format the chosen components and wrap them in an Excuse."""
+        # High-entropy seed used only for scoring/metadata; do NOT reseed RNG
+        quantum_seed = self._generate_quantum_seed(error_message)
+
         # Construct the excuse
         excuse_text = self.formatter.format_excuse(
             primary_excuse=primary_excuse,
@@ -137,22 +318,16 @@ class ExcuseGenerator:
             severity=severity,
         )
 
-        # Get recommendation
-        recommendation = random.choice(
-            self.data.get("recommendations", ["Try turning it off and on again"])
-        )
-
         # Calculate quality score
         quality_score = self._calculate_quality_score(excuse_text, quantum_seed)
 
-        # Create Excuse object
-        excuse = Excuse(
+        return Excuse(
             text=excuse_text,
             recommendation=recommendation,
             severity=severity,
             category=primary_category,
             quality_score=quality_score,
-            quantum_probability=random.random(),
+            quantum_probability=self._rng.random(),
             language=self.language,
             timestamp=time.time(),
             metadata={
@@ -163,41 +338,50 @@ class ExcuseGenerator:
             },
         )
 
-        return excuse
-
     def _generate_quantum_seed(self, error_message: str) -> int:
         """
-        Generate a high-entropy 64-bit seed that changes on every call,
-        even when invoked multiple times within the same OS clock tick.
+        Generate a 64-bit seed that changes on every call.
+
+        The seed only feeds the quality score, so it comes from a dedicated
+        (non-cryptographic) RNG rather than hashing clocks and process ids.
         """
-        t1 = time.time_ns()
-        t2 = time.perf_counter_ns()  # monotonic, high-res
-        pid = os.getpid()
-        tid = threading.get_ident()
-        ctr = next(_SEED_COUNTER)
-        h = hashlib.blake2b(digest_size=8)
-        h.update(f"{error_message}|{t1}|{t2}|{pid}|{tid}|{ctr}".encode("utf-8"))
-        return int.from_bytes(h.digest(), "big")
+        return _SEED_RNG.getrandbits(64)
 
-    def _get_intensifier(self, severity: str) -> str:
-        """Get an intensifier based on severity."""
+    @functools.cached_property
+    def _connectors(self) -> Tuple[str, ...]:
+        """Connector phrases, resolved on first use."""
+        return tuple(self.data.get("connectors", ["which caused"]))
+
+    @functools.cached_property
+    def _recommendations(self) -> Tuple[str, ...]:
+        """Recommendations, resolved on first use."""
+        return tuple(
+            self.data.get("recommendations", ["Try turning it off and on again"])
+        )
+
+    @functools.cached_property
+    def _intensifiers(self) -> Dict[str, Tuple[str, ...]]:
+        """Intensifiers keyed by severity, resolved on first use."""
         intensifiers = self.data.get("intensifiers", {})
+        if not isinstance(intensifiers, dict):
+            return {}
+        return {severity: tuple(pool) for severity, pool in intensifiers.items()}
 
-        if isinstance(intensifiers, dict):
-            severity_intensifiers = intensifiers.get(severity, ["definitely"])
-        else:
-            severity_intensifiers = ["definitely"]
+    def _intensifier_pool(self, severity: str) -> Sequence[str]:
+        """Get the intensifiers available for a severity."""
+        return self._intensifiers.get(severity, ("definitely",))
 
-        return random.choice(severity_intensifiers)
+    def _get_intensifier(self, severity: str) -> str:
+        """Get an intensifier based on severity."""
+        return self._rng.choice(self._intensifier_pool(severity))
 
     def _calculate_quality_score(self, excuse_text: str, seed: int) -> int:
         """Calculate a 'quality score' for the excuse."""
         score = len(excuse_text) * seed % 100
 
-        bonus_words = ["quantum", "cosmic", "AI", "blockchain", "neural"]
-        for word in bonus_words:
-            if word.lower() in excuse_text.lower():
-                score = min(100, score + 5)
+        # Substring matches, as before: "ai" also counts inside "blockchain"
+        lowered = excuse_text.lower()
+        score += 5 * sum(word in lowered for word in _BONUS_WORDS)
 
         return max(1, min(100, score))
 
@@ -206,29 +390,26 @@ class ExcuseGenerator:
         Generate multiple excuses, ensuring textual uniqueness.
         """
         excuses: List[Excuse] = []
-        seen: set[str] = set()
-
-        # Sample error messages for variety
-        sample_errors = [
-            "FATAL ERROR: Everything is broken!",
-            "SegmentationFault: Core dumped",
-            "NullPointerException at line infinity",
-            "KeyError: 'success'",
-            "RuntimeError: Unknown error occurred",
-            "ValueError: Invalid value",
-            "TypeError: Type mismatch",
-            "MemoryError: Out of memory",
-        ]
+        seen: Set[str] = set()
 
         attempts = 0
         max_attempts = count * 10
         while len(excuses) < count and attempts < max_attempts:
-            error = random.choice(sample_errors)
-            excuse = self.generate(error)
-            if excuse.text not in seen:
-                seen.add(excuse.text)
-                excuses.append(excuse)
-            attempts += 1
+            # Draw the errors for this round up front, generate each error's
+            # excuses in one generate_many call, then restore the drawn order
+            errors = self._rng.choices(
+                _SAMPLE_ERRORS, k=min(count - len(excuses), max_attempts - attempts)
+            )
+            generated = {
+                error: iter(self.generate_many(n, error))
+                for error, n in Counter(errors).items()
+            }
+            for error in errors:
+                excuse = next(generated[error])
+                if excuse.text not in seen:
+                    seen.add(excuse.text)
+                    excuses.append(excuse)
+            attempts += len(errors)
 
         return excuses
 
@@ -236,19 +417,12 @@ class ExcuseGenerator:
         """
         Generate an excuse in haiku format.
         """
-        haiku_formatter = HaikuFormatter()
-
         components = {
-            "line_5_1": random.choice(
-                self.data.get("quantum", ["Quantum states collapse"])
-            ),
-            "line_7": random.choice(
-                self.data.get("cosmic", ["The cosmos interferes today"])
-            ),
-            "line_5_2": random.choice(self.data.get("ai", ["AI has gone rogue"])),
+            line: self._rng.choice(self.data.get(category, fallback))
+            for line, (category, fallback) in _HAIKU_SOURCES.items()
         }
 
-        return haiku_formatter.format_haiku(components)
+        return self.haiku_formatter.format_haiku(components)
 
 
 class CosmicExcuse(ExcuseGenerator):
@@ -257,8 +431,13 @@ class CosmicExcuse(ExcuseGenerator):
     Extends ExcuseGenerator with additional convenience methods.
     """
 
-    def __init__(self, language: str = "en", data_path: Optional[Path] = None):
-        super().__init__(language, data_path)
+    def __init__(
+        self,
+        language: str = "en",
+        data_path: Optional[Path] = None,
+        rng: Optional[random.Random] = None,
+    ):
+        super().__init__(language, data_path, rng)
         self.history: List[Excuse] = []
 
     def generate(
@@ -274,11 +453,25 @@ class CosmicExcuse(ExcuseGenerator):
             self.history.append(excuse)
         return excuse
 
+    def generate_many(
+        self,
+        count: int,
+        error_message: str = "",
+        context: Optional[str] = None,
+        category: Optional[str] = None,
+        save_history: bool = True,
+    ) -> List[Excuse]:
+        """Generate several excuses and optionally save them to history."""
+        excuses = super().generate_many(count, error_message, context, category)
+        if save_history:
+            self.history.extend(excuses)
+        return excuses
+
     def get_best_excuse(self) -> Optional[Excuse]:
         """Get the highest quality excuse from history."""
-        if not self.history:
-            return None
-        return max(self.history, key=lambda x: x.quality_score)
+        # history is a public list that callers may edit in place, so no
+        # cached best can be trusted; scan it with a C-level key function
+        return max(self.history, key=attrgetter("quality_score"), default=None)
 
     def clear_history(self):
         """Clear the excuse history."""
@@ -310,3 +503,22 @@ class CosmicExcuse(ExcuseGenerator):
             )
         else:
             raise ValueError(f"Unsupported format: {format}")
+
+
+@functools.lru_cache(maxsize=4)
+def get_cached_generator(language: str = "en") -> CosmicExcuse:
+    """
+    Return a shared CosmicExcuse for a language, constructing it on first use.
+
+    Construction loads and parses every data file and trains the Markov
+    chain, so in-process callers that generate repeatedly should reuse one
+    instance. Callers should pass ``save_history=False`` when generating so
+    the shared history does not grow.
+
+    Args:
+        language: Language code ('en' or 'bn')
+
+    Returns:
+        A cached CosmicExcuse instance
+    """
+    return CosmicExcuse(language=language)
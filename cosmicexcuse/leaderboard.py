@@ -2,16 +2,28 @@
 Excuse leaderboard module for tracking and ranking excuses.
 """
 
+import heapq
+import itertools
 import json
+import os
 import sqlite3
+import sys
+import threading
 import time
+from collections import Counter
 from contextlib import contextmanager
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, TextIO, Tuple
 
+from cosmicexcuse._json import dumpb, dumps, loads
 
-@dataclass
+# LeaderboardEntry has defaulted fields, which a hand-written __slots__
+# cannot coexist with, so slots are only used where dataclass supports them
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class LeaderboardEntry:
     """Represents a leaderboard entry."""
 
@@ -43,7 +55,40 @@ class LeaderboardEntry:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        # A literal avoids asdict()'s recursive deep copy of every field
+        return {
+            "excuse_text": self.excuse_text,
+            "quality_score": self.quality_score,
+            "severity": self.severity,
+            "category": self.category,
+            "language": self.language,
+            "timestamp": self.timestamp,
+            "upvotes": self.upvotes,
+            "downvotes": self.downvotes,
+            "metadata": dict(self.metadata),
+        }
+
+
+# Columns mapped onto LeaderboardEntry fields, in constructor order
+_ENTRY_COLUMNS = (
+    "excuse_text, quality_score, severity, category, language, "
+    "upvotes, downvotes, timestamp, metadata"
+)
+
+
+def _row_to_entry(row: sqlite3.Row) -> LeaderboardEntry:
+    """Build a LeaderboardEntry from a row selected with _ENTRY_COLUMNS."""
+    return LeaderboardEntry(
+        excuse_text=row["excuse_text"],
+        quality_score=row["quality_score"],
+        severity=row["severity"],
+        category=row["category"],
+        language=row["language"],
+        timestamp=row["timestamp"],
+        upvotes=row["upvotes"],
+        downvotes=row["downvotes"],
+        metadata=json.loads(row["metadata"]) if row["metadata"] else {},
+    )
 
 
 class ExcuseLeaderboard:
@@ -51,22 +96,76 @@ class ExcuseLeaderboard:
     Manages a leaderboard of excuses with various ranking methods.
     """
 
-    def __init__(self, max_size: int = 100, storage_path: Optional[Path] = None):
+    def __init__(
+        self,
+        max_size: int = 100,
+        storage_path: Optional[Path] = None,
+        save_interval: float = 0.0,
+    ):
         """
         Initialize leaderboard.
 
         Args:
             max_size: Maximum number of entries to keep
             storage_path: Optional path for persistent storage
+            save_interval: Minimum seconds between automatic saves; changes
+                made in between are written by the next save or flush()
         """
         self.max_size = max_size
-        self.entries: List[LeaderboardEntry] = []
+        self._set_entries([])
         self.storage_path = storage_path
+        self.save_interval = save_interval
+        self._dirty = False
+        self._last_save = float("-inf")
 
         # Load existing data if storage path provided
         if self.storage_path:
             self.load()
 
+    @property
+    def entries(self) -> Tuple[LeaderboardEntry, ...]:
+        """
+        Entries in insertion order, as a read-only snapshot.
+
+        Add entries with add_excuse() or replace them all by assigning a new
+        sequence; a tuple makes in-place edits fail instead of being lost.
+        """
+        return tuple(self._entries.values())
+
+    @entries.setter
+    def entries(self, entries: Iterable[LeaderboardEntry]) -> None:
+        self._set_entries(entries)
+
+    def _set_entries(self, entries: Iterable[LeaderboardEntry]) -> None:
+        """Replace all entries, rebuilding the in-memory indexes."""
+        # Entries keyed by insertion sequence number, plus a min-heap of
+        # (quality_score, -seq) so the lowest-scoring entry (newest first
+        # among ties) can be evicted without re-sorting
+        self._entries: Dict[int, LeaderboardEntry] = {}
+        self._heap: List[Tuple[int, int]] = []
+        self._seq = itertools.count()
+        # Sequence numbers of the entries holding each text, oldest first
+        self._by_text: Dict[str, List[int]] = {}
+        # Cached get_stats() result, dropped whenever the entries change
+        self._stats: Optional[Dict[str, Any]] = None
+        for entry in entries:
+            self._insert(entry)
+
+    def _insert(self, entry: LeaderboardEntry) -> None:
+        """Insert an entry, evicting the lowest-scoring one if over max_size."""
+        seq = next(self._seq)
+        self._entries[seq] = entry
+        self._by_text.setdefault(entry.excuse_text, []).append(seq)
+        heapq.heappush(self._heap, (entry.quality_score, -seq))
+
+        if len(self._entries) > self.max_size:
+            _, neg_seq = heapq.heappop(self._heap)
+            evicted = self._entries.pop(-neg_seq)
+            seqs = self._by_text[evicted.excuse_text]
+            seqs.remove(-neg_seq)
+            if not seqs:
+                del self._by_text[evicted.excuse_text]
+
     def add_excuse(
         self,
         excuse_text: str,
@@ -100,17 +199,8 @@ class ExcuseLeaderboard:
             metadata=metadata or {},
         )
 
-        self.entries.append(entry)
-
-        # Maintain max size
-        if len(self.entries) > self.max_size:
-            # Remove lowest quality score
-            self.entries.sort(key=lambda x: x.quality_score, reverse=True)
-            self.entries = self.entries[: self.max_size]
-
-        # Save if storage enabled
-        if self.storage_path:
-            self.save()
+        self._insert(entry)
+        self._changed()
 
         return entry
 
@@ -141,16 +231,17 @@ class ExcuseLeaderboard:
             excuse_text: The excuse text to vote on
             upvote: True for upvote, False for downvote
         """
-        for entry in self.entries:
-            if entry.excuse_text == excuse_text:
-                if upvote:
-                    entry.upvotes += 1
-                else:
-                    entry.downvotes += 1
+        seqs = self._by_text.get(excuse_text)
+        if not seqs:
+            return
 
-                if self.storage_path:
-                    self.save()
-                break
+        # Votes go to the oldest entry with this text
+        entry = self._entries[seqs[0]]
+        if upvote:
+            entry.upvotes += 1
+        else:
+            entry.downvotes += 1
+        self._changed()
 
     def get_top_by_quality(self, n: int = 10) -> List[LeaderboardEntry]:
         """
@@ -162,10 +253,7 @@ class ExcuseLeaderboard:
         Returns:
             List of top entries
         """
-        sorted_entries = sorted(
-            self.entries, key=lambda x: x.quality_score, reverse=True
-        )
-        return sorted_entries[:n]
+        return heapq.nlargest(n, self._entries.values(), key=lambda x: x.quality_score)
 
     def get_top_by_votes(self, n: int = 10) -> List[LeaderboardEntry]:
         """
@@ -177,8 +265,7 @@ class ExcuseLeaderboard:
         Returns:
             List of top entries
         """
-        sorted_entries = sorted(self.entries, key=lambda x: x.net_votes, reverse=True)
-        return sorted_entries[:n]
+        return heapq.nlargest(n, self._entries.values(), key=lambda x: x.net_votes)
 
     def get_most_controversial(self, n: int = 10) -> List[LeaderboardEntry]:
         """
@@ -190,10 +277,9 @@ class ExcuseLeaderboard:
         Returns:
             List of most controversial entries
         """
-        sorted_entries = sorted(
-            self.entries, key=lambda x: x.controversy_score, reverse=True
+        return heapq.nlargest(
+            n, self._entries.values(), key=lambda x: x.controversy_score
         )
-        return sorted_entries[:n]
 
     def get_recent(self, n: int = 10) -> List[LeaderboardEntry]:
         """
@@ -205,8 +291,7 @@ class ExcuseLeaderboard:
         Returns:
             List of recent entries
         """
-        sorted_entries = sorted(self.entries, key=lambda x: x.timestamp, reverse=True)
-        return sorted_entries[:n]
+        return heapq.nlargest(n, self._entries.values(), key=lambda x: x.timestamp)
 
     def get_by_category(self, category: str, n: int = 10) -> List[LeaderboardEntry]:
         """
@@ -219,9 +304,8 @@ class ExcuseLeaderboard:
         Returns:
             List of entries in category
         """
-        filtered = [e for e in self.entries if e.category == category]
-        sorted_entries = sorted(filtered, key=lambda x: x.quality_score, reverse=True)
-        return sorted_entries[:n]
+        filtered = (e for e in self._entries.values() if e.category == category)
+        return heapq.nlargest(n, filtered, key=lambda x: x.quality_score)
 
     def get_by_severity(self, severity: str, n: int = 10) -> List[LeaderboardEntry]:
         """
@@ -234,18 +318,55 @@ class ExcuseLeaderboard:
         Returns:
             List of entries with severity
         """
-        filtered = [e for e in self.entries if e.severity == severity]
-        sorted_entries = sorted(filtered, key=lambda x: x.quality_score, reverse=True)
-        return sorted_entries[:n]
+        filtered = (e for e in self._entries.values() if e.severity == severity)
+        return heapq.nlargest(n, filtered, key=lambda x: x.quality_score)
 
     def get_stats(self) -> Dict[str, Any]:
         """
         Get leaderboard statistics.
 
+        The result is cached until the next add_excuse, vote, clear or load;
+        entries edited in place are not noticed.
+
         Returns:
             Dictionary with statistics
         """
-        if not self.entries:
+        if self._stats is None:
+            self._stats = self._compute_stats()
+
+        stats = self._stats
+        # Hand out fresh count dicts so callers cannot corrupt the cache
+        return {
+            **stats,
+            "categories": dict(stats["categories"]),
+            "severities": dict(stats["severities"]),
+            "languages": dict(stats["languages"]),
+        }
+
+    def _compute_stats(self) -> Dict[str, Any]:
+        """Aggregate every statistic in a single pass over the entries."""
+        total = quality_sum = upvotes = downvotes = 0
+        best: Optional[LeaderboardEntry] = None
+        worst: Optional[LeaderboardEntry] = None
+        categories: Counter = Counter()
+        severities: Counter = Counter()
+        languages: Counter = Counter()
+
+        for entry in self._entries.values():
+            total += 1
+            score = entry.quality_score
+            quality_sum += score
+            upvotes += entry.upvotes
+            downvotes += entry.downvotes
+            categories[entry.category] += 1
+            severities[entry.severity] += 1
+            languages[entry.language] += 1
+            if best is None or score > best.quality_score:
+                best = entry
+            if worst is None or score < worst.quality_score:
+                worst = entry
+
+        if best is None or worst is None:
             return {
                 "total_excuses": 0,
                 "average_quality": 0,
@@ -254,67 +375,61 @@ class ExcuseLeaderboard:
                 "languages": {},
             }
 
-        total = len(self.entries)
-        avg_quality = sum(e.quality_score for e in self.entries) / total
-
-        # Count by category
-        categories = {}
-        for entry in self.entries:
-            categories[entry.category] = categories.get(entry.category, 0) + 1
-
-        # Count by severity
-        severities = {}
-        for entry in self.entries:
-            severities[entry.severity] = severities.get(entry.severity, 0) + 1
-
-        # Count by language
-        languages = {}
-        for entry in self.entries:
-            languages[entry.language] = languages.get(entry.language, 0) + 1
-
-        # Find best and worst
-        best = (
-            max(self.entries, key=lambda x: x.quality_score) if self.entries else None
-        )
-        worst = (
-            min(self.entries, key=lambda x: x.quality_score) if self.entries else None
-        )
-
         return {
             "total_excuses": total,
-            "average_quality": avg_quality,
-            "categories": categories,
-            "severities": severities,
-            "languages": languages,
-            "best_excuse": best.excuse_text if best else None,
-            "best_score": best.quality_score if best else None,
-            "worst_excuse": worst.excuse_text if worst else None,
-            "worst_score": worst.quality_score if worst else None,
-            "total_upvotes": sum(e.upvotes for e in self.entries),
-            "total_downvotes": sum(e.downvotes for e in self.entries),
+            "average_quality": quality_sum / total,
+            "categories": dict(categories),
+            "severities": dict(severities),
+            "languages": dict(languages),
+            "best_excuse": best.excuse_text,
+            "best_score": best.quality_score,
+            "worst_excuse": worst.excuse_text,
+            "worst_score": worst.quality_score,
+            "total_upvotes": upvotes,
+            "total_downvotes": downvotes,
         }
 
     def clear(self):
         """Clear all entries."""
-        self.entries.clear()
-        if self.storage_path:
+        self.entries = []
+        self._changed()
+
+    def _changed(self) -> None:
+        """Save after a change, unless the last save was too recent."""
+        self._stats = None
+        if not self.storage_path:
+            return
+
+        self._dirty = True
+        if time.monotonic() - self._last_save >= self.save_interval:
+            self.save()
+
+    def flush(self) -> None:
+        """Write any changes held back by save_interval."""
+        if self._dirty:
             self.save()
 
     def save(self):
-        """Save leaderboard to storage."""
+        """Save leaderboard to storage as compact JSON, replacing it atomically."""
         if not self.storage_path:
             return
 
         data = {
-            "entries": [entry.to_dict() for entry in self.entries],
+            "entries": [entry.to_dict() for entry in self._entries.values()],
             "max_size": self.max_size,
             "timestamp": time.time(),
         }
 
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(self.storage_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Write beside the target and swap it in, so an interrupted save
+        # never leaves a truncated file behind
+        tmp_path = self.storage_path.with_name(self.storage_path.name + ".tmp")
+        tmp_path.write_bytes(dumpb(data))
+        os.replace(tmp_path, self.storage_path)
+
+        self._dirty = False
+        self._last_save = time.monotonic()
 
     def load(self):
         """Load leaderboard from storage."""
@@ -322,16 +437,12 @@ class ExcuseLeaderboard:
             return
 
         try:
-            with open(self.storage_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = loads(self.storage_path.read_bytes())
 
-            self.entries = [
-                LeaderboardEntry(**entry) for entry in data.get("entries", [])
-            ]
+            entries = [LeaderboardEntry(**entry) for entry in data.get("entries", [])]
 
             # Maintain max size
-            if len(self.entries) > self.max_size:
-                self.entries = self.entries[: self.max_size]
+            self.entries = entries[: self.max_size]
 
         except Exception:
             # If loading fails, start fresh
@@ -347,19 +458,30 @@ class ExcuseLeaderboard:
         Returns:
             Exported data as string
         """
+        from io import StringIO
+
+        output = StringIO()
+        self.export_to(output, format)
+        return output.getvalue()
+
+    def export_to(self, fh: TextIO, format: str = "json") -> None:
+        """
+        Write the leaderboard to a text file object in the specified format.
+
+        Rows are written as they are produced, so large leaderboards can be
+        exported straight to disk without building the whole string first.
+
+        Args:
+            fh: Writable text file object (open CSV files with newline="")
+            format: Export format ('json', 'csv', 'markdown')
+        """
         if format == "json":
-            return json.dumps(
-                [entry.to_dict() for entry in self.entries],
-                indent=2,
-                ensure_ascii=False,
-            )
+            fh.write(dumps([entry.to_dict() for entry in self.entries], indent=True))
 
         elif format == "csv":
             import csv
-            from io import StringIO
 
-            output = StringIO()
-            writer = csv.writer(output)
+            writer = csv.writer(fh)
 
             # Header
             writer.writerow(
@@ -376,43 +498,37 @@ class ExcuseLeaderboard:
             )
 
             # Data
-            for entry in self.entries:
-                writer.writerow(
-                    [
-                        entry.excuse_text,
-                        entry.quality_score,
-                        entry.severity,
-                        entry.category,
-                        entry.language,
-                        entry.upvotes,
-                        entry.downvotes,
-                        entry.timestamp,
-                    ]
+            writer.writerows(
+                (
+                    entry.excuse_text,
+                    entry.quality_score,
+                    entry.severity,
+                    entry.category,
+                    entry.language,
+                    entry.upvotes,
+                    entry.downvotes,
+                    entry.timestamp,
                 )
-
-            return output.getvalue()
+                for entry in self.entries
+            )
 
         elif format == "markdown":
-            lines = ["# Excuse Leaderboard\n"]
+            fh.write("# Excuse Leaderboard\n")
 
             # Top by quality
-            lines.append("## Top by Quality Score\n")
+            fh.write("\n## Top by Quality Score\n")
             for i, entry in enumerate(self.get_top_by_quality(5), 1):
-                lines.append(
-                    f"{i}. **Score {entry.quality_score}**: {entry.excuse_text}"
-                )
+                fh.write(f"\n{i}. **Score {entry.quality_score}**: {entry.excuse_text}")
 
-            lines.append("\n## Top by Votes\n")
+            fh.write("\n\n## Top by Votes\n")
             for i, entry in enumerate(self.get_top_by_votes(5), 1):
-                lines.append(f"{i}. **+{entry.net_votes}**: {entry.excuse_text}")
+                fh.write(f"\n{i}. **+{entry.net_votes}**: {entry.excuse_text}")
 
             # Stats
             stats = self.get_stats()
-            lines.append("\n## Statistics\n")
-            lines.append(f"- Total Excuses: {stats['total_excuses']}")
-            lines.append(f"- Average Quality: {stats['average_quality']:.1f}")
-
-            return "\n".join(lines)
+            fh.write("\n\n## Statistics\n")
+            fh.write(f"\n- Total Excuses: {stats['total_excuses']}")
+            fh.write(f"\n- Average Quality: {stats['average_quality']:.1f}")
 
         else:
             raise ValueError(f"Unsupported format: {format}")
@@ -421,6 +537,9 @@ class ExcuseLeaderboard:
 class GlobalLeaderboard(ExcuseLeaderboard):
     """
     Global leaderboard with database backend for persistence.
+
+    Entries live in SQLite rather than in memory, so rankings, filters and
+    statistics are answered by indexed queries.
     """
 
     def __init__(self, db_path: Path):
@@ -432,11 +551,19 @@ class GlobalLeaderboard(ExcuseLeaderboard):
         """
         super().__init__(max_size=1000)
         self.db_path = db_path
+        # One connection for the leaderboard's lifetime, shared across
+        # threads under a lock, instead of a connect/close per call
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
         self._init_db()
 
     def _init_db(self):
         """Initialize database schema."""
         with self._get_db() as conn:
+            # Write-ahead logging is stored in the database file: readers no
+            # longer block the writer and commits append instead of rewriting
+            conn.execute("PRAGMA journal_mode=WAL")
+
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS excuses (
@@ -468,13 +595,243 @@ class GlobalLeaderboard(ExcuseLeaderboard):
             """
             )
 
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_net_votes
+                ON excuses((upvotes - downvotes) DESC)
+            """
+            )
+
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_category
+                ON excuses(category, quality_score DESC)
+            """
+            )
+
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_severity
+                ON excuses(severity, quality_score DESC)
+            """
+            )
+
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_timestamp
+                ON excuses(timestamp DESC)
+            """
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open and tune a connection to the database."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        # With WAL, NORMAL only syncs at checkpoints and stays crash-safe
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        return conn
+
     @contextmanager
     def _get_db(self):
-        """Get database connection context manager."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-            conn.commit()
-        finally:
-            conn.close()
+        """Get database connection context manager (one transaction)."""
+        with self._lock:
+            if self._conn is None:
+                self._conn = self._connect()
+            # Commits on success and rolls back on error
+            with self._conn:
+                yield self._conn
+
+    def close(self) -> None:
+        """Close the database connection; it is reopened on next use."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _query(
+        self, where: str, order: str, params: Tuple[Any, ...], n: int
+    ) -> List[LeaderboardEntry]:
+        """Fetch up to n entries, ordered with insertion order breaking ties."""
+        with self._get_db() as conn:
+            rows = conn.execute(
+                f"SELECT {_ENTRY_COLUMNS} FROM excuses {where} "
+                f"ORDER BY {order}, id ASC LIMIT ?",
+                (*params, n),
+            ).fetchall()
+        return [_row_to_entry(row) for row in rows]
+
+    @property
+    def entries(self) -> Tuple[LeaderboardEntry, ...]:
+        """All entries in insertion order, as a read-only snapshot."""
+        return tuple(self._query("", "id", (), -1))
+
+    @entries.setter
+    def entries(self, entries: Iterable[LeaderboardEntry]) -> None:
+        with self._get_db() as conn:
+            conn.execute("DELETE FROM excuses")
+            self._upsert(conn, entries)
+
+    def _insert(self, entry: LeaderboardEntry) -> None:
+        """Upsert an entry by text, evicting the lowest scores over max_size."""
+        self.bulk_add([entry])
+
+    def bulk_add(self, entries: Iterable[LeaderboardEntry]) -> None:
+        """
+        Add many entries in a single transaction.
+
+        Entries whose text is already on the board are refreshed but keep
+        their votes; the lowest scores are then evicted down to max_size.
+
+        Args:
+            entries: Entries to add
+        """
+        with self._get_db() as conn:
+            self._upsert(conn, entries)
+
+    def _upsert(
+        self, conn: sqlite3.Connection, entries: Iterable[LeaderboardEntry]
+    ) -> None:
+        """Upsert entries on an open connection, then enforce max_size."""
+        # Re-adding a known text refreshes it but keeps its votes
+        conn.executemany(
+            f"""
+            INSERT INTO excuses ({_ENTRY_COLUMNS})
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(excuse_text) DO UPDATE SET
+                quality_score = excluded.quality_score,
+                severity = excluded.severity,
+                category = excluded.category,
+                language = excluded.language,
+                timestamp = excluded.timestamp,
+                metadata = excluded.metadata
+        """,
+            (
+                (
+                    entry.excuse_text,
+                    entry.quality_score,
+                    entry.severity,
+                    entry.category,
+                    entry.language,
+                    entry.upvotes,
+                    entry.downvotes,
+                    entry.timestamp,
+                    json.dumps(entry.metadata, ensure_ascii=False, default=str),
+                )
+                for entry in entries
+            ),
+        )
+        conn.execute(
+            """
+            DELETE FROM excuses WHERE id IN (
+                SELECT id FROM excuses
+                ORDER BY quality_score ASC, id DESC
+                LIMIT MAX(0, (SELECT COUNT(*) FROM excuses) - ?)
+            )
+        """,
+            (self.max_size,),
+        )
+
+    def vote(self, excuse_text: str, upvote: bool = True) -> None:
+        """
+        Vote on an excuse.
+
+        Args:
+            excuse_text: The excuse text to vote on
+            upvote: True for upvote, False for downvote
+        """
+        column = "upvotes" if upvote else "downvotes"
+        with self._get_db() as conn:
+            conn.execute(
+                f"UPDATE excuses SET {column} = {column} + 1 WHERE excuse_text = ?",
+                (excuse_text,),
+            )
+
+    def get_top_by_quality(self, n: int = 10) -> List[LeaderboardEntry]:
+        """Get top excuses by quality score."""
+        return self._query("", "quality_score DESC", (), n)
+
+    def get_top_by_votes(self, n: int = 10) -> List[LeaderboardEntry]:
+        """Get top excuses by net votes."""
+        return self._query("", "(upvotes - downvotes) DESC", (), n)
+
+    def get_most_controversial(self, n: int = 10) -> List[LeaderboardEntry]:
+        """Get most controversial excuses."""
+        return self._query(
+            "",
+            "MIN(upvotes, downvotes) * 1.0 / MAX(upvotes, downvotes, 1)"
+            " * (upvotes + downvotes) DESC",
+            (),
+            n,
+        )
+
+    def get_recent(self, n: int = 10) -> List[LeaderboardEntry]:
+        """Get most recent excuses."""
+        return self._query("", "timestamp DESC", (), n)
+
+    def get_by_category(self, category: str, n: int = 10) -> List[LeaderboardEntry]:
+        """Get top excuses in a specific category."""
+        return self._query("WHERE category = ?", "quality_score DESC", (category,), n)
+
+    def get_by_severity(self, severity: str, n: int = 10) -> List[LeaderboardEntry]:
+        """Get top excuses by severity."""
+        return self._query("WHERE severity = ?", "quality_score DESC", (severity,), n)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get leaderboard statistics, aggregated in SQL.
+
+        Returns:
+            Dictionary with statistics
+        """
+        with self._get_db() as conn:
+            total, avg_quality, upvotes, downvotes = conn.execute(
+                "SELECT COUNT(*), AVG(quality_score), SUM(upvotes), SUM(downvotes)"
+                " FROM excuses"
+            ).fetchone()
+            if not total:
+                return {
+                    "total_excuses": 0,
+                    "average_quality": 0,
+                    "categories": {},
+                    "severities": {},
+                    "languages": {},
+                }
+
+            counts = {
+                column: dict(
+                    conn.execute(
+                        f"SELECT {column}, COUNT(*) FROM excuses GROUP BY {column}"
+                        " ORDER BY MIN(id)"
+                    ).fetchall()
+                )
+                for column in ("category", "severity", "language")
+            }
+            best = conn.execute(
+                "SELECT excuse_text, quality_score FROM excuses"
+                " ORDER BY quality_score DESC, id ASC LIMIT 1"
+            ).fetchone()
+            worst = conn.execute(
+                "SELECT excuse_text, quality_score FROM excuses"
+                " ORDER BY quality_score ASC, id ASC LIMIT 1"
+            ).fetchone()
+
+        return {
+            "total_excuses": total,
+            "average_quality": avg_quality,
+            "categories": counts["category"],
+            "severities": counts["severity"],
+            "languages": counts["language"],
+            "best_excuse": best[0],
+            "best_score": best[1],
+            "worst_excuse": worst[0],
+            "worst_score": worst[1],
+            "total_upvotes": upvotes,
+            "total_downvotes": downvotes,
+        }
+
+    def clear(self) -> None:
+        """Clear all entries."""
+        with self._get_db() as conn:
+            conn.execute("DELETE FROM excuses")
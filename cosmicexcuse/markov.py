@@ -2,9 +2,53 @@
 Markov chain text generator module.
 """
 
+import bisect
+import itertools
 import random
+import sys
 from collections import defaultdict
-from typing import Dict, List, Optional
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+# Sampling table for one key: (next words, running totals of their counts)
+_CumWeights = Tuple[Tuple[str, ...], Tuple[int, ...]]
+
+# Snapshot of a trained chain: counts, starters, sampling tables, keys in
+# training order and keys containing each word
+_Tables = Tuple[
+    Mapping[tuple, Dict[str, int]],
+    Sequence[tuple],
+    Mapping[tuple, _CumWeights],
+    Sequence[tuple],
+    Mapping[str, Sequence[tuple]],
+]
+
+# Default technical corpus every chain starts from
+_DEFAULT_CORPUS = """
+distributed systems consensus algorithm byzantine fault tolerance
+eventual consistency CAP theorem race condition deadlock mutex
+garbage collection memory leak stack overflow heap corruption
+cache miss branch prediction pipeline stall context switch
+virtual memory page fault segmentation violation kernel panic
+quantum supremacy neural architecture tensor flow gradient descent
+backpropagation activation function loss landscape optimization
+container orchestration service mesh circuit breaker load balancer
+microservice architecture event sourcing CQRS saga pattern
+blockchain immutable ledger smart contract proof of work
+machine learning deep learning reinforcement learning transfer
+natural language processing computer vision generative adversarial
+edge computing fog computing serverless lambda function
+kubernetes docker swarm container registry helm chart
+continuous integration continuous deployment infrastructure code
+test driven development behavior driven agile scrum kanban
+object oriented functional programming reactive streams
+asynchronous programming callback promise async await
+RESTful API GraphQL gRPC websocket protocol buffer
+SQL NoSQL ACID BASE CAP eventual consistency
+indexing sharding partitioning replication clustering
+encryption hashing salting JWT OAuth SAML SSO
+firewall VPN proxy reverse proxy CDN WAF DDoS
+monitoring logging tracing metrics alerting observability
+"""
 
 
 class MarkovChain:
@@ -12,6 +56,10 @@ class MarkovChain:
     Simple Markov chain text generator for technical jargon.
     """
 
+    # Tables trained from a default corpus, keyed by (order, corpus) and
+    # shared read-only; instances start from a copy instead of retraining
+    _default_tables: Dict[Tuple[int, str], _Tables] = {}
+
     def __init__(self, order: int = 1):
         """
         Initialize Markov chain generator.
@@ -20,39 +68,79 @@ class MarkovChain:
             order: The order of the Markov chain (default 1)
         """
         self.order = order
-        self.chain: Dict[tuple, List[str]] = defaultdict(list)
+        # Private RNG; seed via markov._rng.seed(x) for reproducible output
+        self._rng = random.Random()
+        # Transition counts: key -> {next word: occurrences}
+        self.chain: Dict[tuple, Dict[str, int]] = defaultdict(dict)
         self.starters: List[tuple] = []
+        # Sampling tables derived from chain: key -> (next words, running
+        # totals of their counts), so a draw is one bisect per word
+        self._cum_weights: Dict[tuple, _CumWeights] = {}
+        # Keys in training order, and the keys containing each word, so
+        # generate() never has to scan the whole chain
+        self._key_list: List[tuple] = []
+        self._keys_by_word: Dict[str, List[tuple]] = {}
 
         # Default technical corpus
-        self.default_corpus = """
-        distributed systems consensus algorithm byzantine fault tolerance
-        eventual consistency CAP theorem race condition deadlock mutex
-        garbage collection memory leak stack overflow heap corruption
-        cache miss branch prediction pipeline stall context switch
-        virtual memory page fault segmentation violation kernel panic
-        quantum supremacy neural architecture tensor flow gradient descent
-        backpropagation activation function loss landscape optimization
-        container orchestration service mesh circuit breaker load balancer
-        microservice architecture event sourcing CQRS saga pattern
-        blockchain immutable ledger smart contract proof of work
-        machine learning deep learning reinforcement learning transfer
-        natural language processing computer vision generative adversarial
-        edge computing fog computing serverless lambda function
-        kubernetes docker swarm container registry helm chart
-        continuous integration continuous deployment infrastructure code
-        test driven development behavior driven agile scrum kanban
-        object oriented functional programming reactive streams
-        asynchronous programming callback promise async await
-        RESTful API GraphQL gRPC websocket protocol buffer
-        SQL NoSQL ACID BASE CAP eventual consistency
-        indexing sharding partitioning replication clustering
-        encryption hashing salting JWT OAuth SAML SSO
-        firewall VPN proxy reverse proxy CDN WAF DDoS
-        monitoring logging tracing metrics alerting observability
-        """
+        self.default_corpus = _DEFAULT_CORPUS
 
         # Build default chain
-        self.train(self.default_corpus.split())
+        self._train_default()
+
+    def _train_default(self) -> None:
+        """Train on the default corpus, reusing tables built earlier."""
+        cache_key = (self.order, self.default_corpus)
+        tables = MarkovChain._default_tables.get(cache_key)
+        if tables is None:
+            self.train(self.default_corpus.split())
+            MarkovChain._default_tables[cache_key] = (
+                {key: dict(counts) for key, counts in self.chain.items()},
+                tuple(self.starters),
+                dict(self._cum_weights),
+                tuple(self._key_list),
+                {word: tuple(keys) for word, keys in self._keys_by_word.items()},
+            )
+            return
+
+        self._load_tables(tables)
+
+    def _load_tables(self, tables: _Tables) -> None:
+        """Replace this chain's tables with copies of the given ones."""
+        # Copy the mutable parts, since train() updates them in place
+        chain, starters, cum_weights, key_list, keys_by_word = tables
+        self.chain.clear()
+        self.chain.update((key, dict(counts)) for key, counts in chain.items())
+        self.starters[:] = starters
+        self._cum_weights.clear()
+        self._cum_weights.update(cum_weights)
+        self._key_list[:] = key_list
+        self._keys_by_word.clear()
+        self._keys_by_word.update(
+            (word, list(keys)) for word, keys in keys_by_word.items()
+        )
+
+    def copy(self) -> "MarkovChain":
+        """
+        Return an independent chain with the same training.
+
+        The copy has its own RNG, and training or resetting either chain
+        leaves the other unchanged.
+
+        Returns:
+            New MarkovChain
+        """
+        clone = type(self)(self.order)
+        clone.default_corpus = self.default_corpus
+        clone._load_tables(
+            (
+                self.chain,
+                self.starters,
+                self._cum_weights,
+                self._key_list,
+                self._keys_by_word,
+            )
+        )
+        return clone
 
     def train(self, corpus: List[str]):
         """
@@ -64,16 +152,36 @@ class MarkovChain:
         if len(corpus) < self.order + 1:
             return
 
+        # Interned tokens make repeated words one shared object, so keys
+        # hash from cached values and mostly compare by identity
+        corpus = [sys.intern(word) for word in corpus]
+
         # Build chain
+        touched = set()
         for i in range(len(corpus) - self.order):
             key = tuple(corpus[i : i + self.order])
             value = corpus[i + self.order]
-            self.chain[key].append(value)
+            counts = self.chain.get(key)
+            if counts is None:
+                counts = self.chain[key] = {}
+                self._key_list.append(key)
+                for word in dict.fromkeys(key):
+                    self._keys_by_word.setdefault(word, []).append(key)
+            counts[value] = counts.get(value, 0) + 1
+            touched.add(key)
 
             # Track potential starters
             if i == 0 or corpus[i][0].isupper():
                 self.starters.append(key)
 
+        # Refresh the sampling tables of the keys this corpus changed
+        for key in touched:
+            counts = self.chain[key]
+            self._cum_weights[key] = (
+                tuple(counts),
+                tuple(itertools.accumulate(counts.values())),
+            )
+
         # Ensure we have starters
         if not self.starters and self.chain:
             self.starters = list(self.chain.keys())
@@ -89,49 +197,65 @@ class MarkovChain:
         Returns:
             Generated text string
         """
+        return self.generate_many(1, length, start_word)[0]
+
+    def generate_many(
+        self, count: int, length: int = 5, start_word: Optional[str] = None
+    ) -> List[str]:
+        """
+        Generate several texts, sharing the per-call setup between them.
+
+        Args:
+            count: Number of texts to generate
+            length: Number of words per text
+            start_word: Optional starting word
+
+        Returns:
+            List of generated text strings
+        """
         if not self.chain:
-            return "technical difficulties"
-
-        # Choose starting point
-        if start_word:
-            # Find keys that contain the start word
-            matching_keys = [k for k in self.chain.keys() if start_word in k]
-            if matching_keys:
-                current = random.choice(matching_keys)
-            else:
-                current = (
-                    random.choice(self.starters)
-                    if self.starters
-                    else random.choice(list(self.chain.keys()))
-                )
-        else:
-            current = (
-                random.choice(self.starters)
-                if self.starters
-                else random.choice(list(self.chain.keys()))
-            )
+            return ["technical difficulties"] * count
 
-        result = list(current)
+        choice = self._rng.choice
+        randrange = self._rng.randrange
+        cum_weights_of = self._cum_weights
+        order = self.order
 
-        # Generate text
-        for _ in range(length - self.order):
-            if current in self.chain:
-                next_word = random.choice(self.chain[current])
-                result.append(next_word)
+        # Choose starting points: keys containing the start word if any,
+        # otherwise the recorded starters
+        starts = (start_word and self._keys_by_word.get(start_word)) or (
+            self.starters or self._key_list
+        )
 
-                # Update current key
-                if self.order == 1:
-                    current = (next_word,)
-                else:
-                    current = tuple(list(current)[1:] + [next_word])
-            else:
-                # Dead end, pick a new random key
-                if self.chain:
-                    current = random.choice(list(self.chain.keys()))
+        texts = []
+        for _ in range(count):
+            current = choice(starts)
+            result = list(current)
+
+            # Generate text
+            for _ in range(length - order):
+                table = cum_weights_of.get(current)
+                if table:
+                    words, cum_weights = table
+                    # Weighted pick, as random.choices(cum_weights=...) would
+                    # make without its per-call argument checks
+                    next_word = words[
+                        bisect.bisect_right(cum_weights, randrange(cum_weights[-1]))
+                    ]
+                    result.append(next_word)
+
+                    # Update current key
+                    if order == 1:
+                        current = (next_word,)
+                    else:
+                        current = current[1:] + (next_word,)
                 else:
-                    break
+                    # Dead end, pick a new random key
+                    current = choice(self._key_list)
+
+            texts.append(" ".join(result))
 
-        return " ".join(result)
+        return texts
 
     def generate_sentence(self, min_length: int = 3, max_length: int = 10) -> str:
         """
@@ -144,7 +268,7 @@ class MarkovChain:
         Returns:
             Generated sentence
         """
-        length = random.randint(min_length, max_length)
+        length = self._rng.randint(min_length, max_length)
         return self.generate(length)
 
     def add_corpus(self, text: str):
@@ -161,6 +285,9 @@ class MarkovChain:
         """Reset the Markov chain."""
         self.chain.clear()
         self.starters.clear()
+        self._cum_weights.clear()
+        self._key_list.clear()
+        self._keys_by_word.clear()
 
         # Rebuild with default corpus
-        self.train(self.default_corpus.split())
+        self._train_default()
@@ -2,12 +2,76 @@
 Utility functions for CosmicExcuse.
 """
 
+import bisect
+import functools
 import hashlib
+import itertools
+import os
 import random
 import re
 import time
+from collections import deque
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, FrozenSet, List, Optional, Tuple
+
+_WORD_RE = re.compile(r"\b[a-zA-Z]+\b")
+
+_SENTENCE_END_RE = re.compile(r"[.!?]+")
+
+_LANGUAGE_CODE_RE = re.compile(r"^[a-z]{2}$")
+
+# Error type/code patterns for parse_error_code, highest priority first
+_ERROR_CODE_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"([A-Z][a-zA-Z]+Error)(?:\s*:\s*(.+))?",  # PythonError: message
+        r"(ERROR)\s+(\d+)",  # ERROR 404
+        r"([A-Z]+)-(\d+)",  # HTTP-500
+        r"(0x[0-9A-Fa-f]+)",  # Hex error codes
+        r"(\w+Exception)(?:\s*:\s*(.+))?",  # JavaException: message
+    )
+)
+
+_HUMAN_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S UTC"
+
+# str.translate table deleting ASCII characters that are neither printable
+# nor whitespace; a full Unicode table would be too costly to build
+_ASCII_CONTROL = dict.fromkeys(
+    code for code in range(128) if not (chr(code).isprintable() or chr(code).isspace())
+)
+
+# Words too common to count as keywords
+_COMMON_WORDS = frozenset(
+    {
+        "the",
+        "and",
+        "for",
+        "are",
+        "but",
+        "not",
+        "you",
+        "all",
+        "was",
+        "were",
+        "been",
+        "have",
+        "has",
+        "had",
+        "will",
+        "would",
+        "could",
+        "should",
+        "may",
+        "might",
+        "can",
+        "this",
+        "that",
+        "these",
+        "those",
+        "with",
+        "from",
+    }
+)
 
 
 def generate_seed(input_string: str, salt: Optional[str] = None) -> int:
@@ -26,8 +90,9 @@ def generate_seed(input_string: str, salt: Optional[str] = None) -> int:
     else:
         input_string = f"{input_string}{time.time()}"
 
-    hash_hex = hashlib.md5(input_string.encode()).hexdigest()
-    return int(hash_hex[:8], 16)
+    # Same value as the first 8 hex digits, without the hex round trip
+    digest = hashlib.md5(input_string.encode()).digest()
+    return int.from_bytes(digest[:4], "big")
 
 
 def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
@@ -62,53 +127,14 @@ def extract_keywords(text: str, min_length: int = 3) -> List[str]:
     Returns:
         List of keywords
     """
-    # Remove special characters and split
-    words = re.findall(r"\b[a-zA-Z]+\b", text.lower())
-
-    # Filter by length and remove common words
-    common_words = {
-        "the",
-        "and",
-        "for",
-        "are",
-        "but",
-        "not",
-        "you",
-        "all",
-        "was",
-        "were",
-        "been",
-        "have",
-        "has",
-        "had",
-        "will",
-        "would",
-        "could",
-        "should",
-        "may",
-        "might",
-        "can",
-        "this",
-        "that",
-        "these",
-        "those",
-        "with",
-        "from",
-    }
-
-    keywords = [
-        word for word in words if len(word) >= min_length and word not in common_words
-    ]
-
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_keywords = []
-    for word in keywords:
-        if word not in seen:
-            seen.add(word)
-            unique_keywords.append(word)
-
-    return unique_keywords
+    # One pass: filter matches and drop repeats, keeping first occurrences
+    return list(
+        dict.fromkeys(
+            word
+            for word in _WORD_RE.findall(text.lower())
+            if len(word) >= min_length and word not in _COMMON_WORDS
+        )
+    )
 
 
 def calculate_similarity(text1: str, text2: str) -> float:
@@ -126,8 +152,8 @@ def calculate_similarity(text1: str, text2: str) -> float:
         return 0.0
 
     # Extract keywords from both texts
-    keywords1 = set(extract_keywords(text1))
-    keywords2 = set(extract_keywords(text2))
+    keywords1 = _keyword_set(text1)
+    keywords2 = _keyword_set(text2)
 
     if not keywords1 and not keywords2:
         return 1.0 if text1 == text2 else 0.0
@@ -135,11 +161,15 @@ def calculate_similarity(text1: str, text2: str) -> float:
     if not keywords1 or not keywords2:
         return 0.0
 
-    # Calculate Jaccard similarity
-    intersection = keywords1.intersection(keywords2)
-    union = keywords1.union(keywords2)
+    # Jaccard similarity; |A | B| = |A| + |B| - |A & B| saves building the union
+    shared = len(keywords1 & keywords2)
+    return shared / (len(keywords1) + len(keywords2) - shared)
+
 
-    return len(intersection) / len(union)
+@functools.lru_cache(maxsize=2048)
+def _keyword_set(text: str) -> FrozenSet[str]:
+    """Keywords of a text as a set, memoized for repeated comparisons."""
+    return frozenset(extract_keywords(text))
 
 
 def format_timestamp(timestamp: float, format: str = "human") -> str:
@@ -153,30 +183,37 @@ def format_timestamp(timestamp: float, format: str = "human") -> str:
     Returns:
         Formatted timestamp string
     """
+    if format == "relative":
+        # Plain float arithmetic; split like a timedelta (floored days plus
+        # 0 <= seconds < 86400) so the thresholds behave as before
+        days, seconds = divmod(time.time() - timestamp, 86400)
+        days, seconds = int(days), int(seconds)
+
+        if days > 365:
+            return _ago(days // 365, "year")
+        elif days > 30:
+            return _ago(days // 30, "month")
+        elif days > 0:
+            return _ago(days, "day")
+        elif seconds > 3600:
+            return _ago(seconds // 3600, "hour")
+        elif seconds > 60:
+            return _ago(seconds // 60, "minute")
+        else:
+            return "just now"
+
     dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
 
     if format == "iso":
         return dt.isoformat()
 
-    elif format == "relative":
-        now = datetime.now(timezone.utc)
-        delta = now - dt
-
-        if delta.days > 365:
-            return f"{delta.days // 365} year{'s' if delta.days // 365 > 1 else ''} ago"
-        elif delta.days > 30:
-            return f"{delta.days // 30} month{'s' if delta.days // 30 > 1 else ''} ago"
-        elif delta.days > 0:
-            return f"{delta.days} day{'s' if delta.days > 1 else ''} ago"
-        elif delta.seconds > 3600:
-            return f"{delta.seconds // 3600} hour{'s' if delta.seconds // 3600 > 1 else ''} ago"
-        elif delta.seconds > 60:
-            return f"{delta.seconds // 60} minute{'s' if delta.seconds // 60 > 1 else ''} ago"
-        else:
-            return "just now"
-
     else:  # human format
-        return dt.strftime("%Y-%m-%d %H:%M:%S UTC")
+        return dt.strftime(_HUMAN_TIMESTAMP_FORMAT)
+
+
+def _ago(count: int, unit: str) -> str:
+    """Phrase a relative time, e.g. '3 days ago'."""
+    return f"{count} {unit}{'s' if count > 1 else ''} ago"
 
 
 def weighted_choice(choices: Dict[Any, float]) -> Any:
@@ -192,19 +229,41 @@ def weighted_choice(choices: Dict[Any, float]) -> Any:
     if not choices:
         return None
 
-    total = sum(choices.values())
-    if total <= 0:
-        return random.choice(list(choices.keys()))
+    return WeightedSampler(choices).pick()
+
+
+class WeightedSampler:
+    """
+    Weighted random chooser for a fixed set of choices.
+
+    Cumulative weights are computed once, so each pick is a binary search
+    instead of a scan; hold on to an instance when sampling the same
+    choices repeatedly.
+    """
+
+    def __init__(self, choices: Dict[Any, float]):
+        """
+        Initialize the sampler.
+
+        Args:
+            choices: Non-empty dictionary mapping choices to weights
+        """
+        self.keys = list(choices)
+        self.cum_weights = list(itertools.accumulate(choices.values()))
 
-    r = random.uniform(0, total)
-    upto = 0
+    def pick(self) -> Any:
+        """
+        Make a weighted random choice.
 
-    for choice, weight in choices.items():
-        if upto + weight >= r:
-            return choice
-        upto += weight
+        Returns:
+            Selected choice (uniform among all choices if no weight is positive)
+        """
+        total = self.cum_weights[-1]
+        if total <= 0:
+            return random.choice(self.keys)
 
-    return random.choice(list(choices.keys()))
+        index = bisect.bisect_left(self.cum_weights, random.uniform(0, total))
+        return self.keys[min(index, len(self.keys) - 1)]
 
 
 def sanitize_input(text: str, max_length: int = 1000) -> str:
@@ -221,8 +280,11 @@ def sanitize_input(text: str, max_length: int = 1000) -> str:
     if not text:
         return ""
 
-    # Remove control characters
-    text = "".join(char for char in text if char.isprintable() or char.isspace())
+    # Remove control characters, at C speed in the common all-ASCII case
+    if text.isascii():
+        text = text.translate(_ASCII_CONTROL)
+    elif not text.isprintable():
+        text = "".join(char for char in text if char.isprintable() or char.isspace())
 
     # Normalize whitespace
     text = " ".join(text.split())
@@ -243,18 +305,11 @@ def parse_error_code(error_message: str) -> Optional[Tuple[str, str]]:
     Returns:
         Tuple of (error_type, error_code) or None
     """
-    patterns = [
-        r"([A-Z][a-zA-Z]+Error)(?:\s*:\s*(.+))?",  # PythonError: message
-        r"(ERROR)\s+(\d+)",  # ERROR 404
-        r"([A-Z]+)-(\d+)",  # HTTP-500
-        r"(0x[0-9A-Fa-f]+)",  # Hex error codes
-        r"(\w+Exception)(?:\s*:\s*(.+))?",  # JavaException: message
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, error_message)
+    # Patterns are tried in priority order, not by position in the message
+    for pattern in _ERROR_CODE_PATTERNS:
+        match = pattern.search(error_message)
         if match:
-            if len(match.groups()) == 2:
+            if pattern.groups == 2:
                 return (match.group(1), match.group(2) or "")
             else:
                 return (match.group(1), "")
@@ -269,9 +324,27 @@ def generate_error_id() -> str:
     Returns:
         Unique error ID string
     """
-    timestamp = int(time.time() * 1000)
-    random_part = random.randint(1000, 9999)
-    return f"ERR-{timestamp}-{random_part}"
+    elapsed_ms = (time.perf_counter_ns() - _ID_EPOCH_PERF_NS) // 1_000_000
+    timestamp = _ID_EPOCH_MS + elapsed_ms
+    # A counter cannot repeat within 9000 ids, unlike random.randint
+    unique_part = 1000 + next(_id_counter) % 9000
+    return f"ERR-{timestamp}-{unique_part}"
+
+
+def _reset_id_counter() -> None:
+    """Start the error ID counter at a random offset (again after a fork)."""
+    global _id_counter
+    _id_counter = itertools.count(random.randrange(9000))
+
+
+# Error IDs read the fast monotonic clock against a wall-clock epoch taken
+# once at import, and take their suffix from a counter
+_ID_EPOCH_MS = int(time.time() * 1000)
+_ID_EPOCH_PERF_NS = time.perf_counter_ns()
+_id_counter = itertools.count(random.randrange(9000))
+if hasattr(os, "register_at_fork"):
+    # Forked processes would otherwise hand out the parent's sequence
+    os.register_at_fork(after_in_child=_reset_id_counter)
 
 
 def split_into_sentences(text: str) -> List[str]:
@@ -285,7 +358,7 @@ def split_into_sentences(text: str) -> List[str]:
         List of sentences
     """
     # Simple sentence splitter
-    sentences = re.split(r"[.!?]+", text)
+    sentences = _SENTENCE_END_RE.split(text)
     return [s.strip() for s in sentences if s.strip()]
 
 
@@ -299,7 +372,7 @@ def is_valid_language_code(code: str) -> bool:
     Returns:
         True if valid
     """
-    return bool(re.match(r"^[a-z]{2}$", code.lower()))
+    return bool(_LANGUAGE_CODE_RE.match(code.lower()))
 
 
 def estimate_reading_time(text: str, wpm: int = 200) -> int:
@@ -353,7 +426,8 @@ class RateLimiter:
         """
         self.max_calls = max_calls
         self.period = period
-        self.calls: List[float] = []
+        # Call times, oldest first, so expired ones come off the left
+        self.calls: Deque[float] = deque()
 
     def is_allowed(self) -> bool:
         """
@@ -365,7 +439,10 @@ class RateLimiter:
         now = time.time()
 
         # Remove old calls outside the period
-        self.calls = [t for t in self.calls if now - t < self.period]
+        cutoff = now - self.period
+        calls = self.calls
+        while calls and calls[0] <= cutoff:
+            calls.popleft()
 
         # Check if we can make another call
         if len(self.calls) < self.max_calls:
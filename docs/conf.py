@@ -2,30 +2,42 @@
 Configuration file for the Sphinx documentation builder.
 """
 
+import ast
 import os
-import sys
-from datetime import datetime
 
-# Add project root to path
-sys.path.insert(0, os.path.abspath(".."))
-
-# Import version
-from cosmicexcuse.__version__ import __version__
+# Read version metadata without importing the package; AutoAPI documents
+# the source statically, so the build never needs to import cosmicexcuse
+_VERSION_FILE = os.path.join(
+    os.path.dirname(__file__), "..", "cosmicexcuse", "__version__.py"
+)
+with open(_VERSION_FILE, encoding="utf-8") as fh:
+    _metadata = {
+        node.targets[0].id: ast.literal_eval(node.value)
+        for node in ast.parse(fh.read()).body
+        if isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Name)
+    }
+
+__version__ = _metadata["__version__"]
+__copyright__ = _metadata["__copyright__"]
 
 # -- Project information -----------------------------------------------------
 
 project = "CosmicExcuse"
-copyright = f"{datetime.now().year}, Shamsuddin Ahmed"
+# A fixed string: a value that changes (like the current year) would make
+# Sphinx discard its cached environment and re-read every page
+copyright = __copyright__.replace("Copyright ", "", 1)
 author = "Shamsuddin Ahmed"
 release = __version__
 version = __version__
 
 # -- General configuration ---------------------------------------------------
 
+needs_sphinx = "8.1"
+
 extensions = [
-    "sphinx.ext.autodoc",
+    "autoapi.extension",
     "sphinx.ext.napoleon",
-    "sphinx.ext.viewcode",
+    "sphinx.ext.linkcode",
     "sphinx.ext.intersphinx",
     "sphinx.ext.todo",
     "sphinx.ext.coverage",
@@ -40,7 +52,8 @@ master_doc = "index"
 # -- Options for HTML output -------------------------------------------------
 
 html_theme = "sphinx_rtd_theme"
-html_static_path = ["_static"]
+# No custom static assets; an empty list skips the _static scan and copy
+html_static_path = []
 html_logo = None
 html_favicon = None
 
@@ -58,17 +71,66 @@ html_theme_options = {
 
 # -- Extension configuration -------------------------------------------------
 
-# Autodoc settings
-autodoc_default_options = {
-    "members": True,
-    "member-order": "bysource",
-    "special-members": "__init__",
-    "undoc-members": True,
-    "exclude-members": "__weakref__",
-}
+# AutoAPI settings (API pages generated from the source, not imports)
+autoapi_type = "python"
+autoapi_dirs = ["../cosmicexcuse"]
+autoapi_keep_files = True
+autoapi_member_order = "bysource"
+autoapi_options = [
+    "members",
+    "undoc-members",
+    "show-inheritance",
+    "special-members",
+]
 
-autodoc_typehints = "description"
-autodoc_mock_imports = []
+# Link objects to their source on GitHub instead of rendering highlighted
+# copies of every module (sphinx.ext.viewcode)
+_SOURCE_ROOT = os.path.join(os.path.dirname(__file__), "..")
+_SOURCE_URL = "https://github.com/shamspias/cosmicexcuse/blob/v{}/{}"
+
+
+def _module_path(module):
+    """Return the repository-relative source path of a module, if any."""
+    base = module.replace(".", "/")
+    for path in (base + ".py", base + "/__init__.py"):
+        if os.path.isfile(os.path.join(_SOURCE_ROOT, path)):
+            return path
+    return None
+
+
+def _definition_lines(path):
+    """Map top-level and class-level names in a source file to line numbers."""
+    with open(os.path.join(_SOURCE_ROOT, path), encoding="utf-8") as fh:
+        tree = ast.parse(fh.read())
+    lines = {}
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            lines[node.name] = node.lineno
+            for child in getattr(node, "body", []):
+                if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    lines[f"{node.name}.{child.name}"] = child.lineno
+    return lines
+
+
+_line_cache = {}
+
+
+def linkcode_resolve(domain, info):
+    """Return the GitHub URL for a documented Python object."""
+    if domain != "py" or not info.get("module"):
+        return None
+    path = _module_path(info["module"])
+    if path is None:
+        return None
+    if path not in _line_cache:
+        _line_cache[path] = _definition_lines(path)
+    url = _SOURCE_URL.format(__version__, path)
+    line = _line_cache[path].get(info.get("fullname", ""))
+    return f"{url}#L{line}" if line else url
+
+
+# Render annotations as "List[str]" rather than "typing.List[str]"
+python_use_unqualified_type_names = True
 
 # Napoleon settings (for Google/NumPy docstrings)
 napoleon_google_docstring = True
@@ -2,24 +2,33 @@
 Basic usage examples for CosmicExcuse package.
 """
 
-from cosmicexcuse import CosmicExcuse, generate
-from cosmicexcuse.analyzer import SeverityAnalyzer
-from cosmicexcuse.formatter import (
-    MarkdownFormatter,
-    TwitterFormatter,
-)
-from cosmicexcuse.leaderboard import ExcuseLeaderboard
+import functools
+import sys
+from typing import TYPE_CHECKING, Optional
 
+# cosmicexcuse is imported inside each example, so running a single example
+# only loads what that example needs
+if TYPE_CHECKING:
+    from cosmicexcuse import CosmicExcuse
 
-def basic_generation():
+
+@functools.lru_cache(maxsize=None)
+def _default_generator() -> "CosmicExcuse":
+    """Building a generator loads every data file, so the examples share one."""
+    from cosmicexcuse import CosmicExcuse
+
+    return CosmicExcuse(language="en")
+
+
+def basic_generation(generator: Optional["CosmicExcuse"] = None):
     """Basic excuse generation examples."""
+    if generator is None:
+        generator = _default_generator()
+
     print("=" * 60)
     print("BASIC EXCUSE GENERATION")
     print("=" * 60)
 
-    # Create generator
-    generator = CosmicExcuse()
-
     # Generate simple excuse
     excuse = generator.generate()
     print("\n📝 Random Excuse:")
@@ -41,6 +50,8 @@ def basic_generation():
 
 def one_liner_examples():
     """One-liner usage examples."""
+    from cosmicexcuse import generate
+
     print("\n" + "=" * 60)
     print("ONE-LINER EXAMPLES")
     print("=" * 60)
@@ -52,43 +63,52 @@ def one_liner_examples():
     print(f"\n💥 For error: {generate('Segmentation fault')}")
 
 
-def batch_generation():
+def batch_generation(generator: Optional["CosmicExcuse"] = None):
     """Batch generation examples."""
+    if generator is None:
+        generator = _default_generator()
+
     print("\n" + "=" * 60)
     print("BATCH GENERATION")
     print("=" * 60)
 
-    generator = CosmicExcuse()
     excuses = generator.generate_batch(3)
 
     print("\n📦 Generated 3 excuses:")
+    # Collect the listing and write it in one go
+    lines = []
     for i, excuse in enumerate(excuses, 1):
-        print(f"\n   {i}. {excuse.text}")
-        print(f"      Category: {excuse.category}, Score: {excuse.quality_score}")
+        lines.append(f"\n   {i}. {excuse.text}")
+        lines.append(
+            f"      Category: {excuse.category}, Score: {excuse.quality_score}"
+        )
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def haiku_mode():
+def haiku_mode(generator: Optional["CosmicExcuse"] = None):
     """Haiku generation examples."""
+    if generator is None:
+        generator = _default_generator()
+
     print("\n" + "=" * 60)
     print("HAIKU MODE")
     print("=" * 60)
 
-    generator = CosmicExcuse()
     haiku = generator.generate_haiku("Memory leak detected")
 
     print("\n🎋 Error Haiku:")
     print("   " + haiku.replace("\n", "\n   "))
 
 
-def severity_analysis():
+def severity_analysis(generator: Optional["CosmicExcuse"] = None):
     """Severity analysis examples."""
+    if generator is None:
+        generator = _default_generator()
+
     print("\n" + "=" * 60)
     print("SEVERITY ANALYSIS")
     print("=" * 60)
 
-    analyzer = SeverityAnalyzer()
-    generator = CosmicExcuse()
-
     errors = [
         "Warning: deprecated function used",
         "ERROR: Connection timeout",
@@ -96,21 +116,25 @@ def severity_analysis():
     ]
 
     for error in errors:
-        severity = analyzer.analyze(error)
+        # generate() runs the severity analyzer and records its verdict
         excuse = generator.generate(error)
 
         print(f"\n📊 Error: {error}")
-        print(f"   Severity: {severity}")
+        print(f"   Severity: {excuse.severity}")
         print(f"   Excuse: {excuse.text[:100]}...")
 
 
-def formatting_examples():
+def formatting_examples(generator: Optional["CosmicExcuse"] = None):
     """Different formatting examples."""
+    from cosmicexcuse.formatter import MarkdownFormatter, TwitterFormatter
+
+    if generator is None:
+        generator = _default_generator()
+
     print("\n" + "=" * 60)
     print("FORMATTING OPTIONS")
     print("=" * 60)
 
-    generator = CosmicExcuse()
     excuse = generator.generate("Database connection failed")
 
     # Markdown format
@@ -138,13 +162,17 @@ def formatting_examples():
     print(f"   {tweet}")
 
 
-def leaderboard_examples():
+def leaderboard_examples(generator: Optional["CosmicExcuse"] = None):
     """Leaderboard usage examples."""
+    from cosmicexcuse.leaderboard import ExcuseLeaderboard
+
+    if generator is None:
+        generator = _default_generator()
+
     print("\n" + "=" * 60)
     print("LEADERBOARD SYSTEM")
     print("=" * 60)
 
-    generator = CosmicExcuse()
     leaderboard = ExcuseLeaderboard()
 
     # Generate and add excuses
@@ -157,8 +185,12 @@ def leaderboard_examples():
     top_excuses = leaderboard.get_top_by_quality(3)
 
     print("\n📊 Top 3 Excuses by Quality:")
+    lines = []
     for i, entry in enumerate(top_excuses, 1):
-        print(f"\n   {i}. Score {entry.quality_score}: {entry.excuse_text[:80]}...")
+        lines.append(
+            f"\n   {i}. Score {entry.quality_score}: {entry.excuse_text[:80]}..."
+        )
+    sys.stdout.write("\n".join(lines) + "\n")
 
     # Get statistics
     stats = leaderboard.get_stats()
@@ -168,13 +200,17 @@ def leaderboard_examples():
     print(f"   Categories: {stats['categories']}")
 
 
-def history_tracking():
+def history_tracking(generator: Optional["CosmicExcuse"] = None):
     """History tracking examples."""
+    if generator is None:
+        generator = _default_generator()
+
     print("\n" + "=" * 60)
     print("HISTORY TRACKING")
     print("=" * 60)
 
-    generator = CosmicExcuse()
+    # Start from an empty history; the shared generator was used above
+    generator.clear_history()
 
     # Generate some excuses
     print("\n📚 Generating excuses with history...")
@@ -197,6 +233,8 @@ def history_tracking():
 
 def multi_language():
     """Multi-language examples."""
+    from cosmicexcuse import CosmicExcuse
+
     print("\n" + "=" * 60)
     print("MULTI-LANGUAGE SUPPORT")
     print("=" * 60)
@@ -215,14 +253,15 @@ def multi_language():
         print(f"\n🇧🇩 Bengali: Data not available ({e})")
 
 
-def error_handler_integration():
+def error_handler_integration(generator: Optional["CosmicExcuse"] = None):
     """Example of integrating with error handling."""
+    if generator is None:
+        generator = _default_generator()
+
     print("\n" + "=" * 60)
     print("ERROR HANDLER INTEGRATION")
     print("=" * 60)
 
-    generator = CosmicExcuse()
-
     def risky_operation():
         """Simulate a risky operation."""
         raise ValueError("Division by coffee not allowed!")
@@ -250,36 +289,47 @@ def error_handler_integration():
     safe_operation()
 
 
-def main():
-    """Run all examples."""
+# Example name on the command line -> (title, function)
+EXAMPLES = {
+    "basic": ("Basic Generation", basic_generation),
+    "one-liners": ("One-Liners", one_liner_examples),
+    "batch": ("Batch Generation", batch_generation),
+    "haiku": ("Haiku Mode", haiku_mode),
+    "severity": ("Severity Analysis", severity_analysis),
+    "formatting": ("Formatting Options", formatting_examples),
+    "leaderboard": ("Leaderboard System", leaderboard_examples),
+    "history": ("History Tracking", history_tracking),
+    "multi-language": ("Multi-Language", multi_language),
+    "error-handler": ("Error Handler", error_handler_integration),
+}
+
+
+def main(argv=None):
+    """Run all examples, or only those named on the command line."""
+    names = sys.argv[1:] if argv is None else argv
+    unknown = [name for name in names if name not in EXAMPLES]
+    if unknown:
+        print(f"Unknown example(s): {', '.join(unknown)}")
+        print(f"Available: {', '.join(EXAMPLES)}")
+        return 2
+
     print("\n" + "🚀" * 30)
     print(" COSMICEXCUSE EXAMPLES SHOWCASE")
     print("🚀" * 30)
 
-    examples = [
-        ("Basic Generation", basic_generation),
-        ("One-Liners", one_liner_examples),
-        ("Batch Generation", batch_generation),
-        ("Haiku Mode", haiku_mode),
-        ("Severity Analysis", severity_analysis),
-        ("Formatting Options", formatting_examples),
-        ("Leaderboard System", leaderboard_examples),
-        ("History Tracking", history_tracking),
-        ("Multi-Language", multi_language),
-        ("Error Handler", error_handler_integration),
-    ]
-
-    for name, func in examples:
+    for name in names or EXAMPLES:
+        title, func = EXAMPLES[name]
         try:
             func()
         except Exception as e:
-            print(f"\n❌ Example '{name}' failed: {e}")
+            print(f"\n❌ Example '{title}' failed: {e}")
 
     print("\n" + "=" * 60)
     print("✅ EXAMPLES COMPLETE!")
     print("=" * 60)
     print("\nRemember: It's not a bug, it's a quantum feature! 🐛✨")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -3,21 +3,34 @@ Setup configuration for CosmicExcuse package
 """
 
 import os
+import re
 
-from setuptools import find_packages, setup
+from setuptools import setup
 
 # Read the README file
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
-# Read version from __version__.py
-version = {}
-with open(os.path.join("cosmicexcuse", "__version__.py")) as fp:
-    exec(fp.read(), version)
+# Read version from __version__.py without executing it
+with open(os.path.join("cosmicexcuse", "__version__.py"), encoding="utf-8") as fp:
+    version = re.search(
+        r"^__version__\s*=\s*[\"']([^\"']+)[\"']", fp.read(), re.M
+    ).group(1)
+
+# Optionally compile hot modules to C with mypyc (COSMICEXCUSE_USE_MYPYC=1).
+# Falls back to the pure-Python package when mypyc is not installed.
+ext_modules = []
+if os.environ.get("COSMICEXCUSE_USE_MYPYC") == "1":
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        print("mypyc not installed, building pure-Python package")
+    else:
+        ext_modules = mypycify(["cosmicexcuse/analyzer.py"])
 
 setup(
     name="cosmicexcuse",
-    version=version["__version__"],
+    version=version,
     author="Shamsuddin Ahmed",
     author_email="info@shamspias.com",
     description="Generate quantum-grade excuses for your code failures using fake AI",
@@ -29,7 +42,10 @@ setup(
         "Documentation": "https://cosmicexcuse.readthedocs.io/",
         "Source Code": "https://github.com/shamspias/cosmicexcuse",
     },
-    packages=find_packages(exclude=["tests", "tests.*", "examples", "examples.*"]),
+    # Listed explicitly so builds skip the source-tree walk; CI checks it
+    # against find_packages() so a new subpackage is not left out
+    packages=["cosmicexcuse", "cosmicexcuse.data"],
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -59,6 +75,7 @@ setup(
             "mypy>=1.17.1",
             "sphinx>=8.1.3",
             "sphinx-rtd-theme>=3.0.2",
+            "sphinx-autoapi>=3.0.0",
         ],
         "api": [
             "flask>=3.1.2",
@@ -68,6 +85,10 @@ setup(
         "discord": [
             "discord.py>=2.4.0",
         ],
+        "fast": [
+            "pyahocorasick>=2.0.0",
+            "orjson>=3.9.0",
+        ],
     },
     entry_points={
         "console_scripts": [
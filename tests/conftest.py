@@ -1,6 +1,7 @@
 """Pytest configuration and fixtures."""
 
 import json
+import shutil
 
 import pytest
 
@@ -10,18 +11,26 @@ from cosmicexcuse.leaderboard import ExcuseLeaderboard
 from cosmicexcuse.markov import MarkovChain
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def generator():
-    """Fixture for ExcuseGenerator."""
+    """Fixture for ExcuseGenerator, shared by the whole session."""
     return ExcuseGenerator()
 
 
-@pytest.fixture
-def cosmic():
-    """Fixture for CosmicExcuse."""
+@pytest.fixture(scope="session")
+def _shared_cosmic():
+    """Build one CosmicExcuse for the whole session."""
     return CosmicExcuse()
 
 
+@pytest.fixture
+def cosmic(_shared_cosmic):
+    """Fixture for CosmicExcuse, with an empty history for every test."""
+    _shared_cosmic.clear_history()
+    yield _shared_cosmic
+    _shared_cosmic.clear_history()
+
+
 @pytest.fixture
 def analyzer():
     """Fixture for SeverityAnalyzer."""
@@ -40,10 +49,10 @@ def leaderboard():
     return ExcuseLeaderboard()
 
 
-@pytest.fixture
-def temp_data_path(tmp_path):
-    """Create temporary data path for testing."""
-    data_dir = tmp_path / "data" / "en"
+@pytest.fixture(scope="session")
+def _template_data_path(tmp_path_factory):
+    """Write the minimal test data set once per session."""
+    data_dir = tmp_path_factory.mktemp("template") / "data" / "en"
     data_dir.mkdir(parents=True)
 
     # Create minimal test data
@@ -54,6 +63,8 @@ def temp_data_path(tmp_path):
         "excuses": ["test excuse 1", "test excuse 2"],
     }
 
+    # Every category gets the same document, so serialize it once
+    payload = json.dumps(test_data).encode("utf-8")
     for category in [
         "quantum",
         "cosmic",
@@ -63,8 +74,7 @@ def temp_data_path(tmp_path):
         "recommendations",
         "connectors",
     ]:
-        with open(data_dir / f"{category}.json", "w") as f:
-            json.dump(test_data, f)
+        (data_dir / f"{category}.json").write_bytes(payload)
 
     # Intensifiers need special structure
     intensifiers = {
@@ -80,7 +90,15 @@ def temp_data_path(tmp_path):
         "excuses": intensifiers,
     }
 
-    with open(data_dir / "intensifiers.json", "w") as f:
-        json.dump(intensifiers_data, f)
+    (data_dir / "intensifiers.json").write_bytes(
+        json.dumps(intensifiers_data).encode("utf-8")
+    )
+
+    return data_dir.parent
+
 
-    return tmp_path / "data"
+@pytest.fixture
+def temp_data_path(tmp_path, _template_data_path):
+    """Create temporary data path for testing."""
+    # Tests may delete or corrupt files, so each gets its own copy
+    return shutil.copytree(_template_data_path, tmp_path / "data")
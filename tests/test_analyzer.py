@@ -17,42 +17,45 @@ class TestSeverityAnalyzer:
         """Test analyzing empty message."""
         assert analyzer.analyze("") == "mild"
 
-    def test_analyze_mild_errors(self, analyzer):
-        """Test mild error detection."""
-        mild_errors = [
+    @pytest.mark.parametrize(
+        "error",
+        [
             "Warning: deprecated function",
             "INFO: Processing started",
             "Debug: Variable value is 5",
             "Notice: Configuration updated",
-        ]
-
-        for error in mild_errors:
-            assert analyzer.analyze(error) == "mild"
+        ],
+    )
+    def test_analyze_mild_errors(self, analyzer, error):
+        """Test mild error detection."""
+        assert analyzer.analyze(error) == "mild"
 
-    def test_analyze_medium_errors(self, analyzer):
-        """Test medium error detection."""
-        medium_errors = [
+    @pytest.mark.parametrize(
+        "error",
+        [
             "ERROR: Connection failed",
             "Exception: Invalid input",
             "Failed to load resource",
             "Null pointer detected",
-        ]
-
-        for error in medium_errors:
-            severity = analyzer.analyze(error)
-            assert severity in ["medium", "severe"]  # Some might escalate
+        ],
+    )
+    def test_analyze_medium_errors(self, analyzer, error):
+        """Test medium error detection."""
+        severity = analyzer.analyze(error)
+        assert severity in ["medium", "severe"]  # Some might escalate
 
-    def test_analyze_severe_errors(self, analyzer):
-        """Test severe error detection."""
-        severe_errors = [
+    @pytest.mark.parametrize(
+        "error",
+        [
             "FATAL ERROR: System crash!!!",
             "CRITICAL: Database corrupted",
             "PANIC: Kernel panic detected",
             "Segmentation fault (core dumped)",
-        ]
-
-        for error in severe_errors:
-            assert analyzer.analyze(error) == "severe"
+        ],
+    )
+    def test_analyze_severe_errors(self, analyzer, error):
+        """Test severe error detection."""
+        assert analyzer.analyze(error) == "severe"
 
     def test_get_severity_details(self, analyzer):
         """Test getting detailed severity analysis."""
@@ -63,3 +66,53 @@ class TestSeverityAnalyzer:
         assert details["exclamation_count"] == 3
         assert "found_keywords" in details
         assert "found_patterns" in details
+
+    def test_keyword_matching_without_automaton(self, analyzer, monkeypatch):
+        """Test keyword matching falls back when pyahocorasick is missing."""
+        error = "Kernel panic: failed to mount, core dump written"
+        expected = analyzer.get_severity_details(error)
+
+        fallback = SeverityAnalyzer()
+        monkeypatch.setattr(fallback, "_keyword_automaton", None)
+        details = fallback.get_severity_details(error)
+
+        assert details == expected
+        assert details["found_keywords"][:2] == ["panic", "core dump"]
+        assert "fail" in details["found_keywords"]
+        assert "failed" in details["found_keywords"]
+
+    def test_severity_details_are_memoized_copies(self, analyzer):
+        """Test cached details cannot be mutated through returned values."""
+        error = "ERROR: Connection failed"
+        first = analyzer.get_severity_details(error)
+        first["found_keywords"].append("tampered")
+        first["severity"] = "tampered"
+
+        second = analyzer.get_severity_details(error)
+        assert "tampered" not in second["found_keywords"]
+        assert second["severity"] == analyzer.analyze(error)
+        assert analyzer._details_cached.cache_info().hits == 1
+
+    def test_analyze_many(self, analyzer):
+        """Test batch analysis keeps input order and matches analyze()."""
+        errors = ["FATAL ERROR", "Warning: slow", "", "FATAL ERROR"]
+        result = analyzer.analyze_many(errors)
+
+        assert result == [analyzer.analyze(error) for error in errors]
+        assert result[0] == result[3] == "severe"
+        assert analyzer.analyze_many(iter([])) == []
+
+    def test_bounded_gap_patterns(self, analyzer):
+        """Test word-gap patterns match nearby words but stay linear."""
+        assert analyzer.analyze("kernel: task blocked, then PANIC") == "severe"
+        assert (
+            "NULL.{0,64}?POINTER"
+            in analyzer.get_severity_details("Null reference to a pointer")[
+                "found_patterns"
+            ]
+        )
+
+        # Pathological input: many prefixes with no matching suffix
+        details = analyzer.get_severity_details("system " * 5000)
+        assert details["found_patterns"] == []
+        assert details["severity"] == "mild"
@@ -0,0 +1,143 @@
+"""Tests for the command-line interface."""
+
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from cosmicexcuse import cli, get_cached_generator
+
+
+class TestCLI:
+    """Test CLI entry point."""
+
+    def test_main_json_output(self, capsys):
+        """Test JSON output for multiple excuses."""
+        assert cli.main(["--json", "-c", "2", "-e", "FATAL ERROR"]) == 0
+
+        output = json.loads(capsys.readouterr().out)
+        assert len(output) == 2
+        assert all(item["severity"] == "severe" for item in output)
+
+    def test_generate_excuses_min_score(self):
+        """Test oversampling keeps only excuses above the threshold."""
+        generator = get_cached_generator()
+        excuses = cli.generate_excuses(
+            generator, error="ERROR", category=None, count=10, min_score=50
+        )
+        assert len(excuses) == 10
+        assert all(e.quality_score >= 50 for e in excuses)
+
+        # Unreachable thresholds still return the requested count
+        excuses = cli.generate_excuses(
+            generator,
+            error="ERROR",
+            category=None,
+            count=3,
+            min_score=101,
+            max_attempts=2,
+        )
+        assert len(excuses) == 3
+
+    def test_version_skips_generator_import(self):
+        """Test --version loads neither the generator stack nor orjson."""
+        code = (
+            "import sys\n"
+            "from cosmicexcuse import cli\n"
+            "try:\n"
+            "    cli.main(['--version'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "assert 'cosmicexcuse.generator' not in sys.modules\n"
+            "assert 'cosmicexcuse._json' not in sys.modules\n"
+            "assert 'orjson' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True, capture_output=True)
+
+    def test_handle_request_reuses_generators(self):
+        """Test resident requests share one generator per language."""
+        generators = {}
+        first = cli.handle_request(generators, {"error": "ERROR", "count": 2})
+        second = cli.handle_request(generators, {"haiku": True})
+
+        assert len(first["excuses"]) == 2
+        assert len(second["haiku"].split("\n")) == 3
+        assert list(generators) == ["en"]
+
+    def test_print_response_json_matches_local(self, capsys):
+        """Test served excuses print the same JSON shape as local ones."""
+        response = cli.handle_request({}, {"error": "ERROR", "count": 2})
+        args = cli.build_parser().parse_args(["--json", "-c", "2"])
+
+        assert cli.print_response(response, args) == 0
+        assert json.loads(capsys.readouterr().out) == response["excuses"]
+
+    def test_client_without_server_falls_back(self, tmp_path, capsys):
+        """Test --socket without a listening server generates locally."""
+        sock = str(tmp_path / "missing.sock")
+        assert cli.main(["--json", "--socket", sock]) == 0
+        assert len(json.loads(capsys.readouterr().out)) == 1
+
+    @pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs AF_UNIX")
+    def test_serve_refuses_to_replace_non_socket(self, tmp_path, capsys):
+        """Test --serve leaves a regular file at the socket path alone."""
+        path = tmp_path / "notes.txt"
+        path.write_text("keep me", encoding="utf-8")
+
+        assert cli.serve(str(path)) == 1
+        assert path.read_text(encoding="utf-8") == "keep me"
+        assert "not a socket" in capsys.readouterr().err
+
+    @pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs AF_UNIX")
+    def test_serve_survives_stalled_and_vanished_clients(self, tmp_path, monkeypatch):
+        """Test misbehaving clients are dropped and the server keeps serving."""
+        monkeypatch.setattr(cli, "CLIENT_TIMEOUT", 0.2)
+        path = str(tmp_path / "cosmic.sock")
+        threading.Thread(target=cli.serve, args=(path,), daemon=True).start()
+        for _ in range(100):
+            if os.path.exists(path):
+                break
+            time.sleep(0.01)
+
+        # Sends a request but hangs up before reading the reply
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(path)
+            client.sendall(b'{"count": 50}\n')
+        # Connects but never sends anything
+        stalled = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stalled.connect(path)
+        try:
+            response = cli._client_submit(path, {"error": "FATAL"})
+        finally:
+            stalled.close()
+
+        assert response["excuses"][0]["severity"] == "severe"
+
+    @pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs AF_UNIX")
+    def test_client_server_round_trip(self, tmp_path, monkeypatch):
+        """Test a client request served by a resident server."""
+        path = str(tmp_path / "cosmic.sock")
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(path)
+        server.listen()
+
+        def serve_once():
+            conn, _ = server.accept()
+            with conn:
+                request = cli._read_message(conn)
+                cli._send_message(conn, cli.handle_request({}, request))
+
+        thread = threading.Thread(target=serve_once)
+        thread.start()
+        try:
+            response = cli._client_submit(path, {"error": "FATAL", "count": 3})
+        finally:
+            thread.join(timeout=5)
+            server.close()
+
+        assert [e["severity"] for e in response["excuses"]] == ["severe"] * 3
@@ -1,6 +1,7 @@
 """Tests for formatter module."""
 
 import json
+import textwrap
 
 import pytest
 
@@ -51,6 +52,27 @@ class TestExcuseFormatter:
         assert len(result) <= 50
         assert result.endswith("...")
 
+    def test_corporate_batch(self):
+        """Test corporate formatting pairs excuses with recommendations."""
+        formatter = ExcuseFormatter()
+        results = formatter.format_corporate_batch(
+            ["quantum drift", "solar wind"], ["Reboot.", "Wait."]
+        )
+
+        assert len(results) == 2
+        assert "quantum drift" in results[0] and results[0].endswith("Reboot.")
+        assert "solar wind" in results[1] and results[1].endswith("Wait.")
+        assert "cosmic rays" in formatter.format_corporate("cosmic rays", "Pray.")
+
+    def test_corporate_batch_length_mismatch(self):
+        """Test mismatched excuse and recommendation lists are rejected."""
+        formatter = ExcuseFormatter()
+
+        with pytest.raises(ValueError):
+            formatter.format_corporate_batch(["quantum drift", "solar wind"], ["Wait."])
+        with pytest.raises(ValueError):
+            formatter.format_corporate_batch(["quantum drift"], ["Reboot.", "Wait."])
+
 
 class TestHaikuFormatter:
     """Test HaikuFormatter class."""
@@ -64,6 +86,29 @@ class TestHaikuFormatter:
         lines = result.split("\n")
         assert len(lines) == 3
 
+    def test_haiku_seeded_rng(self):
+        """Test seeding the formatter's RNG makes template picks repeatable."""
+        first, second = HaikuFormatter(), HaikuFormatter()
+        first._rng.seed(42)
+        second._rng.seed(42)
+
+        assert [first.format_haiku({}) for _ in range(5)] == [
+            second.format_haiku({}) for _ in range(5)
+        ]
+
+    def test_haiku_truncates_components(self):
+        """Test provided lines are cut to their approximate syllable length."""
+        formatter = HaikuFormatter()
+        components = {
+            "line_5_1": "one two three four five six",
+            "line_7": "  one   two three four five six seven eight",
+            "line_5_2": "single",
+        }
+
+        for _ in range(2):
+            result = formatter.format_haiku(components)
+            assert result == "one two three\none two three four five\nsingle"
+
 
 class TestMarkdownFormatter:
     """Test MarkdownFormatter class."""
@@ -85,6 +130,16 @@ class TestMarkdownFormatter:
         assert "## " in result  # Has headers
         assert "**" in result  # Has bold text
         assert "Test excuse" in result
+        assert "> Try again" in result
+        assert "🟡 Medium" in result
+
+    def test_markdown_technical_analysis(self):
+        """Test the Markov component is rendered in a code block."""
+        formatter = MarkdownFormatter()
+
+        result = formatter.format({"metadata": {"markov_component": "flux drift"}})
+
+        assert "```\nflux drift\n```" in result
 
 
 class TestJSONFormatter:
@@ -108,6 +163,44 @@ class TestJSONFormatter:
         assert parsed["excuse"] == "Test excuse"
         assert parsed["severity"] == "mild"
 
+    def test_json_format_stdlib_fallback(self, monkeypatch):
+        """Test output matches between orjson and the stdlib fallback."""
+        from cosmicexcuse import _json
+
+        data = {"text": "কোয়ান্টাম ত্রুটি", "quality_score": 7}
+        accelerated = JSONFormatter().format(data)
+        accelerated_bytes = _json.dumpb(data)
+
+        monkeypatch.setattr(_json, "orjson", None)
+        fallback = JSONFormatter().format(data)
+
+        assert json.loads(fallback) == json.loads(accelerated)
+        assert "কোয়ান্টাম" in fallback
+        assert json.loads(_json.dumpb(data)) == json.loads(accelerated_bytes)
+
+    def test_stdlib_fallback_formats_like_orjson(self, monkeypatch):
+        """Test the stdlib fallback writes the same text orjson does."""
+        from cosmicexcuse import _json
+
+        data = {"text": "কোয়ান্টাম", "scores": [1, 2], "nested": {"a": None}}
+        monkeypatch.setattr(_json, "orjson", None)
+
+        compact = '{"text":"কোয়ান্টাম","scores":[1,2],"nested":{"a":null}}'
+        assert _json.dumps(data) == compact
+        assert _json.dumpb(data) == compact.encode("utf-8")
+        assert _json.dumps(data, indent=True) == (
+            "{\n"
+            '  "text": "কোয়ান্টাম",\n'
+            '  "scores": [\n'
+            "    1,\n"
+            "    2\n"
+            "  ],\n"
+            '  "nested": {\n'
+            '    "a": null\n'
+            "  }\n"
+            "}"
+        )
+
 
 class TestTwitterFormatter:
     """Test TwitterFormatter class."""
@@ -121,3 +214,23 @@ class TestTwitterFormatter:
 
         assert len(result) <= 280
         assert "#" in result  # Has hashtags
+
+
+class TestPlainTextFormatter:
+    """Test PlainTextFormatter class."""
+
+    def test_wraps_long_text(self):
+        """Test wrapping matches textwrap.fill across repeated calls."""
+        formatter = PlainTextFormatter(width=40)
+        data = {"text": "quantum " * 20, "recommendation": "reboot " * 10}
+
+        first = formatter.format(data)
+        assert first == formatter.format(data)
+        assert (
+            textwrap.fill(f"EXCUSE: {data['text']}", width=40, subsequent_indent="  ")
+            in first
+        )
+        assert all(len(line) <= 40 for line in first.splitlines())
+
+        formatter.width = 60
+        assert "=" * 60 in formatter.format(data)
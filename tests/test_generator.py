@@ -2,6 +2,7 @@
 Tests for the excuse generator module.
 """
 
+import random
 import time
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
@@ -10,7 +11,7 @@ import pytest
 
 from cosmicexcuse import CosmicExcuse, ExcuseGenerator
 from cosmicexcuse.exceptions import LanguageNotSupportedError
-from cosmicexcuse.generator import Excuse
+from cosmicexcuse.generator import Excuse, get_cached_generator
 
 
 class TestExcuseGenerator:
@@ -60,14 +61,13 @@ class TestExcuseGenerator:
         excuse = generator.generate("FATAL ERROR!!! SYSTEM CRASH!!!")
         assert excuse.severity == "severe"
 
-    def test_generate_with_category(self):
+    @pytest.mark.parametrize(
+        "category", ["quantum", "cosmic", "ai", "technical", "blame"]
+    )
+    def test_generate_with_category(self, generator, category):
         """Test generation with specific category."""
-        generator = ExcuseGenerator()
-
-        categories = ["quantum", "cosmic", "ai", "technical", "blame"]
-        for category in categories:
-            excuse = generator.generate(category=category)
-            assert excuse.category == category
+        excuse = generator.generate(category=category)
+        assert excuse.category == category
 
     def test_generate_batch(self):
         """Test batch generation."""
@@ -78,6 +78,64 @@ class TestExcuseGenerator:
         assert all(isinstance(e, Excuse) for e in excuses)
         assert len(set(e.text for e in excuses)) == 5  # All unique
 
+    def test_generate_batch_keeps_texts_with_colliding_hashes(self):
+        """Test distinct texts are kept even when their hashes collide."""
+
+        class CollidingText(str):
+            def __hash__(self):
+                return 42
+
+        generator = ExcuseGenerator()
+        real_generate_many = generator.generate_many
+
+        def generate_many(count, error_message=""):
+            excuses = real_generate_many(count, error_message)
+            for excuse in excuses:
+                excuse.text = CollidingText(excuse.text)
+            return excuses
+
+        with patch.object(generator, "generate_many", side_effect=generate_many):
+            excuses = generator.generate_batch(5)
+
+        assert len(excuses) == 5
+        assert len(set(e.text for e in excuses)) == 5
+
+    def test_meta_category_not_used_as_primary(self):
+        """Test requesting a meta category falls back to an excuse category."""
+        generator = ExcuseGenerator()
+
+        for _ in range(10):
+            excuse = generator.generate(category="connectors")
+            assert excuse.category not in ("recommendations", "connectors")
+            assert excuse.metadata["secondary_category"] != excuse.category
+
+    def test_markov_chain_trained_once_but_not_shared(self):
+        """Test generators reuse the training but own independent chains."""
+        first, second = ExcuseGenerator(), ExcuseGenerator()
+
+        assert first.markov is not second.markov
+        assert first.markov.chain == second.markov.chain
+        assert first.markov.chain != ExcuseGenerator("bn").markov.chain
+
+        first.markov.add_corpus("flux capacitor overload")
+        assert ("capacitor",) not in second.markov.chain
+        first.markov.reset()
+        assert ("capacitor",) not in ExcuseGenerator().markov.chain
+
+    def test_generate_many(self):
+        """Test single-pass generation for one error."""
+        generator = ExcuseGenerator()
+        excuses = generator.generate_many(20, "FATAL ERROR", category="quantum")
+
+        assert len(excuses) == 20
+        assert all(e.category == "quantum" for e in excuses)
+        assert all(e.severity == "severe" for e in excuses)
+        assert all(
+            e.metadata["secondary_category"] not in ("quantum", "connectors")
+            for e in excuses
+        )
+        assert generator.generate_many(0) == []
+
     def test_generate_haiku(self):
         """Test haiku generation."""
         generator = ExcuseGenerator()
@@ -111,6 +169,10 @@ class TestExcuseGenerator:
         score_with_bonus = generator._calculate_quality_score(excuse_with_bonus, seed)
         assert score_with_bonus > 0
 
+        # Bonus words match as substrings, case-insensitively
+        assert generator._calculate_quality_score("x" * 10, 1) == 10
+        assert generator._calculate_quality_score("Blockchain", 1) == 20
+
 
 class TestCosmicExcuse:
     """Test CosmicExcuse main class."""
@@ -121,6 +183,15 @@ class TestCosmicExcuse:
         assert cosmic.language == "en"
         assert cosmic.history == []
 
+    def test_data_not_shared_between_instances(self):
+        """Test editing one instance's data does not leak into new ones."""
+        CosmicExcuse().data["quantum"].append("HACKED")
+        CosmicExcuse().data["intensifiers"]["mild"].append("HACKED")
+
+        fresh = ExcuseGenerator()
+        assert "HACKED" not in fresh.data["quantum"]
+        assert "HACKED" not in fresh.data["intensifiers"]["mild"]
+
     def test_generate_saves_history(self):
         """Test that generation saves to history."""
         cosmic = CosmicExcuse()
@@ -151,6 +222,34 @@ class TestCosmicExcuse:
         assert best is not None
         assert best.quality_score == max(e.quality_score for e in cosmic.history)
 
+    def test_get_best_excuse_after_direct_history_edits(self):
+        """Test the best excuse follows edits made to history directly."""
+        cosmic = CosmicExcuse()
+        cosmic.generate_many(5, "Error")
+
+        best = cosmic.get_best_excuse()
+        cosmic.history.remove(best)
+        assert cosmic.get_best_excuse() is max(
+            cosmic.history, key=lambda e: e.quality_score
+        )
+
+        cosmic.generate("Error")
+        assert cosmic.get_best_excuse() is max(
+            cosmic.history, key=lambda e: e.quality_score
+        )
+
+        # Same-length edits between lookups must not leave a stale best
+        best = cosmic.get_best_excuse()
+        cosmic.history.remove(best)
+        cosmic.generate("Error")
+        assert best not in cosmic.history
+        assert cosmic.get_best_excuse() is max(
+            cosmic.history, key=lambda e: e.quality_score
+        )
+
+        cosmic.clear_history()
+        assert cosmic.get_best_excuse() is None
+
     def test_get_best_excuse_empty_history(self):
         """Test getting best excuse with empty history."""
         cosmic = CosmicExcuse()
@@ -199,6 +298,16 @@ class TestCosmicExcuse:
         with pytest.raises(ValueError):
             cosmic.export_history(format="invalid")
 
+    def test_cached_generator_is_shared(self):
+        """Test the convenience API reuses one generator per language."""
+        import cosmicexcuse
+
+        shared = get_cached_generator("en")
+        assert get_cached_generator("en") is shared
+
+        assert cosmicexcuse.generate("Segmentation fault")
+        assert shared.history == []
+
 
 class TestExcuseDataClass:
     """Test Excuse dataclass."""
@@ -226,6 +335,15 @@ class TestExcuseDataClass:
         assert excuse.language == "en"
         assert excuse.metadata == {"test": "data"}
 
+    def test_excuse_is_slotted_and_picklable(self):
+        """Test Excuse has no per-instance dict and survives pickling."""
+        import pickle
+
+        excuse = ExcuseGenerator().generate("Test error")
+
+        assert not hasattr(excuse, "__dict__")
+        assert pickle.loads(pickle.dumps(excuse)) == excuse
+
 
 class TestIntegration:
     """Integration tests."""
@@ -275,17 +393,30 @@ class TestIntegration:
         # With mocked random, similar inputs might produce similar outputs
         assert excuse1.category == excuse2.category
 
-
-@pytest.fixture
-def generator():
-    """Fixture for ExcuseGenerator."""
-    return ExcuseGenerator()
-
-
-@pytest.fixture
-def cosmic():
-    """Fixture for CosmicExcuse."""
-    return CosmicExcuse()
+    def test_empty_category_file_is_never_picked(self, temp_data_path):
+        """Test a category whose data file is empty is never chosen."""
+        (temp_data_path / "en" / "blame.json").write_text("[]", encoding="utf-8")
+        generator = ExcuseGenerator(data_path=temp_data_path / "en")
+
+        assert "blame" not in generator._primary_categories
+        for _ in range(50):
+            assert generator.generate().category != "blame"
+        assert len(generator.generate_many(20)) == 20
+
+    def test_injected_rng_is_reproducible(self):
+        """Test generators sharing an RNG seed pick the same components."""
+
+        def picks(generator):
+            excuses = [generator.generate("Same error")]
+            excuses += generator.generate_many(3, "Same error")
+            return [
+                (e.category, e.metadata["secondary_category"], e.quantum_probability)
+                for e in excuses
+            ]
+
+        first = ExcuseGenerator(rng=random.Random(42))
+        second = CosmicExcuse(rng=random.Random(42))
+        assert picks(first) == picks(second)
 
 
 def test_generator_fixture(generator):
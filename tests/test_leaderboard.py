@@ -0,0 +1,240 @@
+"""Tests for the leaderboard module."""
+
+import sys
+from dataclasses import asdict
+
+import pytest
+
+from cosmicexcuse.leaderboard import (
+    ExcuseLeaderboard,
+    GlobalLeaderboard,
+    LeaderboardEntry,
+)
+
+
+class TestLeaderboardEntry:
+    """Test LeaderboardEntry class."""
+
+    def test_to_dict_matches_asdict(self):
+        """Test the hand-written to_dict covers every field."""
+        entry = LeaderboardEntry(
+            "text", 50, "high", "cosmic", "en", 1.0, 3, 1, {"source": "test"}
+        )
+        data = entry.to_dict()
+
+        assert data == asdict(entry)
+        assert LeaderboardEntry(**data) == entry
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="needs slots=True")
+    def test_entry_is_slotted(self):
+        """Test entries carry no per-instance __dict__."""
+        entry = LeaderboardEntry("text", 50, "high", "cosmic", "en", 1.0)
+        assert not hasattr(entry, "__dict__")
+
+
+class TestExcuseLeaderboard:
+    """Test ExcuseLeaderboard class."""
+
+    def test_evicts_lowest_score(self):
+        """Test the lowest-scoring entry is dropped once max_size is exceeded."""
+        leaderboard = ExcuseLeaderboard(max_size=3)
+        for i, score in enumerate([50, 10, 70, 30, 90]):
+            leaderboard.add_excuse(f"excuse {i}", score)
+
+        assert [e.quality_score for e in leaderboard.entries] == [50, 70, 90]
+        assert [e.quality_score for e in leaderboard.get_top_by_quality(2)] == [
+            90,
+            70,
+        ]
+
+    def test_eviction_prefers_newest_on_ties(self):
+        """Test the newest of equally low-scoring entries is evicted."""
+        leaderboard = ExcuseLeaderboard(max_size=2)
+        leaderboard.add_excuse("old", 10)
+        leaderboard.add_excuse("high", 80)
+        leaderboard.add_excuse("new", 10)
+
+        assert [e.excuse_text for e in leaderboard.entries] == ["old", "high"]
+
+    def test_entries_is_read_only_snapshot(self, leaderboard):
+        """Test entries cannot be edited in place and can be reassigned."""
+        entry = leaderboard.add_excuse("kept", 50)
+
+        with pytest.raises(AttributeError):
+            leaderboard.entries.append(entry)
+        assert leaderboard.entries == (entry,)
+
+        leaderboard.entries = [
+            entry,
+            LeaderboardEntry("b", 60, "high", "ai", "en", 1.0),
+        ]
+        assert [e.excuse_text for e in leaderboard.get_top_by_quality()] == [
+            "b",
+            "kept",
+        ]
+
+    def test_getters_match_sorted_order(self, leaderboard):
+        """Test top-n getters keep the order of a stable descending sort."""
+        for i, score in enumerate([40, 80, 40, 60]):
+            leaderboard.add_excuse(f"excuse {i}", score, category="cosmic")
+
+        top = leaderboard.get_by_category("cosmic", n=3)
+        assert [e.excuse_text for e in top] == ["excuse 1", "excuse 3", "excuse 0"]
+        assert leaderboard.get_by_category("quantum") == []
+
+    def test_vote_targets_oldest_matching_entry(self, leaderboard):
+        """Test votes go to the first entry with the text, then the next one."""
+        first = leaderboard.add_excuse("same", 10)
+        second = leaderboard.add_excuse("same", 20)
+
+        leaderboard.vote("same")
+        leaderboard.vote("same", upvote=False)
+        leaderboard.vote("missing")
+        assert (first.upvotes, first.downvotes, second.upvotes) == (1, 1, 0)
+
+        small = ExcuseLeaderboard(max_size=1)
+        small.add_excuse("same", 10)
+        kept = small.add_excuse("same", 20)
+        small.vote("same")
+        assert kept.upvotes == 1
+
+    def test_stats_single_pass_and_cached(self, leaderboard):
+        """Test get_stats aggregates correctly and refreshes after changes."""
+        leaderboard.add_excuse("a", 40, category="cosmic")
+        leaderboard.add_excuse("b", 80, severity="critical")
+        leaderboard.add_excuse("c", 80, category="cosmic")
+
+        stats = leaderboard.get_stats()
+        assert stats["categories"] == {"cosmic": 2, "general": 1}
+        assert stats["severities"] == {"medium": 2, "critical": 1}
+        assert (stats["best_excuse"], stats["worst_excuse"]) == ("b", "a")
+        assert stats["average_quality"] == 200 / 3
+
+        stats["categories"]["cosmic"] = 99
+        assert leaderboard.get_stats()["categories"]["cosmic"] == 2
+
+        leaderboard.vote("a")
+        assert leaderboard.get_stats()["total_upvotes"] == 1
+
+    def test_export_to_streams_same_output(self, leaderboard, tmp_path):
+        """Test export_to writes exactly what export returns."""
+        leaderboard.add_excuse('Cosmic, "rays"', 70)
+        leaderboard.add_excuse("Quantum flux", 40)
+
+        for format in ("json", "csv", "markdown"):
+            path = tmp_path / f"board.{format}"
+            with open(path, "w", encoding="utf-8", newline="") as fh:
+                leaderboard.export_to(fh, format)
+            assert path.read_bytes().decode("utf-8") == leaderboard.export(format)
+
+        with pytest.raises(ValueError):
+            leaderboard.export("xml")
+
+    def test_json_export_same_with_or_without_orjson(self, leaderboard, monkeypatch):
+        """Test the JSON export goes through the shared codec either way."""
+        from cosmicexcuse import _json
+
+        leaderboard.add_excuse("কোয়ান্টাম flux", 70)
+        exported = leaderboard.export("json")
+        assert _json.loads(exported) == [
+            entry.to_dict() for entry in leaderboard.entries
+        ]
+        assert "কোয়ান্টাম" in exported
+
+        monkeypatch.setattr(_json, "orjson", None)
+        assert leaderboard.export("json") == exported
+
+    def test_save_interval_coalesces_writes(self, tmp_path):
+        """Test saves are held back by save_interval until flush()."""
+        path = tmp_path / "board.json"
+        leaderboard = ExcuseLeaderboard(storage_path=path, save_interval=3600)
+
+        leaderboard.add_excuse("first", 50)
+        leaderboard.add_excuse("second", 60)
+        leaderboard.vote("second")
+        assert len(ExcuseLeaderboard(storage_path=path).entries) == 1
+
+        leaderboard.flush()
+        reloaded = ExcuseLeaderboard(storage_path=path)
+        assert [e.upvotes for e in reloaded.entries] == [0, 1]
+
+    def test_save_is_compact_and_atomic(self, tmp_path):
+        """Test saves write compact JSON and leave no temporary file."""
+        path = tmp_path / "board.json"
+        leaderboard = ExcuseLeaderboard(storage_path=path)
+        leaderboard.add_excuse("Kosmische Strahlung ☄", 50)
+
+        assert b"\n" not in path.read_bytes()
+        assert list(tmp_path.iterdir()) == [path]
+        reloaded = ExcuseLeaderboard(storage_path=path)
+        assert reloaded.entries[0].excuse_text == "Kosmische Strahlung ☄"
+
+
+class TestGlobalLeaderboard:
+    """Test GlobalLeaderboard class."""
+
+    def test_queries_run_against_database(self, tmp_path):
+        """Test entries persist and getters are served from SQLite."""
+        path = tmp_path / "global.db"
+        leaderboard = GlobalLeaderboard(path)
+        for i, score in enumerate([40, 80, 40, 60]):
+            leaderboard.add_excuse(f"excuse {i}", score, category="cosmic")
+        leaderboard.add_excuse("other", 70, severity="critical")
+        leaderboard.vote("excuse 2")
+        leaderboard.vote("excuse 0", upvote=False)
+
+        reloaded = GlobalLeaderboard(path)
+        top = reloaded.get_by_category("cosmic", n=3)
+        assert [e.excuse_text for e in top] == ["excuse 1", "excuse 3", "excuse 0"]
+        assert [e.excuse_text for e in reloaded.get_by_severity("critical")] == [
+            "other"
+        ]
+        assert reloaded.get_top_by_votes(1)[0].excuse_text == "excuse 2"
+
+        stats = reloaded.get_stats()
+        assert stats["total_excuses"] == 5
+        assert stats["categories"] == {"cosmic": 4, "general": 1}
+        assert (stats["best_excuse"], stats["worst_excuse"]) == (
+            "excuse 1",
+            "excuse 0",
+        )
+        assert (stats["total_upvotes"], stats["total_downvotes"]) == (1, 1)
+
+    def test_readding_keeps_votes_and_evicts(self, tmp_path):
+        """Test re-adding a text keeps its votes and max_size is enforced."""
+        leaderboard = GlobalLeaderboard(tmp_path / "global.db")
+        leaderboard.max_size = 2
+        leaderboard.add_excuse("same", 10)
+        leaderboard.vote("same")
+        leaderboard.add_excuse("same", 50)
+        leaderboard.add_excuse("low", 5)
+        leaderboard.add_excuse("high", 90)
+
+        entries = leaderboard.entries
+        assert [e.excuse_text for e in entries] == ["same", "high"]
+        assert (entries[0].quality_score, entries[0].upvotes) == (50, 1)
+
+        leaderboard.clear()
+        assert leaderboard.get_stats()["total_excuses"] == 0
+
+    def test_bulk_add_single_transaction(self, tmp_path):
+        """Test bulk_add upserts and evicts like repeated add_excuse calls."""
+        path = tmp_path / "global.db"
+        leaderboard = GlobalLeaderboard(path)
+        leaderboard.max_size = 3
+        leaderboard.add_excuse("voted", 20)
+        leaderboard.vote("voted")
+
+        leaderboard.bulk_add(
+            LeaderboardEntry(text, score, "medium", "general", "en", 1.0)
+            for text, score in [("voted", 60), ("a", 10), ("b", 80), ("c", 70)]
+        )
+        leaderboard.close()
+
+        reloaded = GlobalLeaderboard(path)
+        entries = reloaded.entries
+        assert [e.excuse_text for e in entries] == ["voted", "b", "c"]
+        assert entries[0].upvotes == 1
+        with reloaded._get_db() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        reloaded.close()
@@ -0,0 +1,99 @@
+"""Tests for the data loader module."""
+
+import json
+
+import pytest
+
+from cosmicexcuse.data.loader import DataLoader, _read_json
+
+
+class TestDataLoader:
+    """Test DataLoader class."""
+
+    def test_load_all_returns_dict(self, temp_data_path):
+        """Test load_all returns a plain, JSON-serialisable dict."""
+        data = DataLoader("en", temp_data_path / "en").load_all()
+
+        assert type(data) is dict
+        assert list(data) == [
+            "quantum",
+            "cosmic",
+            "ai",
+            "technical",
+            "blame",
+            "recommendations",
+            "connectors",
+            "intensifiers",
+        ]
+        assert data["quantum"] == ["test excuse 1", "test excuse 2"]
+        assert data["intensifiers"]["severe"] == ["catastrophically"]
+        assert json.loads(json.dumps(data)) == data
+
+        data["quantum"] = ["mutated"]
+        assert data["quantum"] == ["mutated"]
+
+    def test_empty_category_never_exposed(self, temp_data_path):
+        """Test a category with an empty file is dropped before it is seen."""
+        (temp_data_path / "en" / "blame.json").write_text("[]", encoding="utf-8")
+
+        data = DataLoader("en", temp_data_path / "en").load_all()
+        assert "blame" not in data
+        assert len(data) == 7
+
+    def test_load_all_skips_missing_files(self, temp_data_path):
+        """Test categories without a data file are not exposed."""
+        (temp_data_path / "en" / "blame.json").unlink()
+
+        with pytest.warns(UserWarning, match="blame.json"):
+            data = DataLoader("en", temp_data_path / "en").load_all()
+
+        assert "blame" not in data
+        assert len(data) == 7
+        with pytest.raises(KeyError):
+            data["blame"]
+
+    def test_parsed_files_shared_until_modified(self, temp_data_path):
+        """Test parsed files are reused across loaders until they change."""
+        import os
+
+        path = temp_data_path / "en" / "cosmic.json"
+        first = DataLoader("en", temp_data_path / "en").load_file("cosmic")
+        hits = _read_json.cache_info().hits
+        second = DataLoader("en", temp_data_path / "en").load_file("cosmic")
+        assert _read_json.cache_info().hits == hits + 1
+        assert first == second
+        assert first is not second
+
+        path.write_text('{"excuses": ["solar flare"]}', encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert DataLoader("en", temp_data_path / "en").load_file("cosmic") == [
+            "solar flare"
+        ]
+
+    def test_missing_file_handling(self, temp_data_path):
+        """Test a missing file yields empty data and fails validation."""
+        (temp_data_path / "en" / "ai.json").unlink()
+        loader = DataLoader("en", temp_data_path / "en")
+
+        with pytest.warns(UserWarning, match="ai.json"):
+            assert loader.load_file("ai") == {}
+        assert loader.validate_data()["ai"] is False
+
+    def test_available_languages(self):
+        """Test the bundled languages are discovered."""
+        loader = DataLoader("en")
+
+        assert sorted(loader.get_available_languages()) == ["bn", "en"]
+        assert loader.get_available_languages() is not (
+            loader.get_available_languages()
+        )
+
+    def test_corrupt_file_uses_fallback(self, temp_data_path):
+        """Test a file that fails to parse falls back to built-in data."""
+        (temp_data_path / "en" / "technical.json").write_text("{", encoding="utf-8")
+
+        with pytest.warns(UserWarning, match="Failed to load technical"):
+            data = DataLoader("en", temp_data_path / "en").load_all()
+
+        assert data["technical"] == ["technical difficulties"]
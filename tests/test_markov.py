@@ -5,14 +5,19 @@ import pytest
 from cosmicexcuse.markov import MarkovChain
 
 
+@pytest.fixture(scope="module")
+def default_markov():
+    """Default chain shared by the tests that only read from it."""
+    return MarkovChain()
+
+
 class TestMarkovChain:
     """Test MarkovChain class."""
 
-    def test_initialization(self):
+    def test_initialization(self, default_markov):
         """Test Markov chain initialization."""
-        markov = MarkovChain()
-        assert markov.order == 1
-        assert markov.chain is not None
+        assert default_markov.order == 1
+        assert default_markov.chain is not None
 
     def test_train(self):
         """Test training on corpus."""
@@ -22,27 +27,21 @@ class TestMarkovChain:
         markov.train(corpus)
         assert len(markov.chain) > 0
 
-    def test_generate(self):
+    def test_generate(self, default_markov):
         """Test text generation."""
-        markov = MarkovChain()
-
-        result = markov.generate(length=5)
+        result = default_markov.generate(length=5)
         assert isinstance(result, str)
         words = result.split()
         assert len(words) >= 1  # At least some output
 
-    def test_generate_with_start_word(self):
+    def test_generate_with_start_word(self, default_markov):
         """Test generation with start word."""
-        markov = MarkovChain()
-
-        result = markov.generate(length=5, start_word="quantum")
+        result = default_markov.generate(length=5, start_word="quantum")
         assert isinstance(result, str)
 
-    def test_generate_sentence(self):
+    def test_generate_sentence(self, default_markov):
         """Test sentence generation."""
-        markov = MarkovChain()
-
-        result = markov.generate_sentence(min_length=3, max_length=10)
+        result = default_markov.generate_sentence(min_length=3, max_length=10)
         assert isinstance(result, str)
 
         word_count = len(result.split())
@@ -56,3 +55,63 @@ class TestMarkovChain:
         markov.reset()
         # Should have default corpus
         assert len(markov.chain) > 0
+
+    def test_repeated_transitions_are_weighted(self):
+        """Test repeated transitions are counted once and sampled by weight."""
+        markov = MarkovChain()
+        markov.add_corpus("alpha beta alpha beta alpha gamma")
+
+        assert markov.chain[("alpha",)] == {"beta": 2, "gamma": 1}
+
+        markov._rng.seed(0)
+        followers = [markov.generate(2, start_word="alpha") for _ in range(300)]
+        betas = followers.count("alpha beta")
+        assert betas + followers.count("alpha gamma") == 300
+        assert 150 < betas < 250
+
+    def test_start_word_uses_keys_containing_it(self):
+        """Test start_word picks among keys that contain the word."""
+        markov = MarkovChain(order=2)
+        markov.add_corpus("zeta eta theta iota kappa")
+
+        for _ in range(20):
+            words = markov.generate(length=2, start_word="eta").split()
+            assert "eta" in words
+            assert words in (["zeta", "eta"], ["eta", "theta"])
+
+    def test_seeded_rng_repeats_output(self):
+        """Test seeding the chain's RNG makes higher-order output repeatable."""
+        markov = MarkovChain(order=2)
+        markov._rng.seed(7)
+        first = [markov.generate(length=8) for _ in range(5)]
+        markov._rng.seed(7)
+        second = [markov.generate(length=8) for _ in range(5)]
+
+        assert first == second
+        assert all(2 <= len(text.split()) <= 8 for text in first)
+
+    def test_generate_many_matches_generate(self):
+        """Test batch generation draws the same texts as repeated generate()."""
+        markov = MarkovChain()
+        markov._rng.seed(3)
+        batch = markov.generate_many(4, length=6, start_word="quantum")
+        markov._rng.seed(3)
+        single = [markov.generate(6, start_word="quantum") for _ in range(4)]
+
+        assert batch == single
+
+        markov.chain.clear()
+        assert markov.generate_many(2) == ["technical difficulties"] * 2
+
+    def test_default_tables_are_copied_per_instance(self):
+        """Test training one chain never leaks into later default chains."""
+        first = MarkovChain()
+        first.add_corpus("quantum flux capacitor quantum entanglement")
+
+        second = MarkovChain()
+        assert ("capacitor",) not in second.chain
+        assert second.chain[("quantum",)] != first.chain[("quantum",)]
+
+        first.reset()
+        assert first.chain == second.chain
+        assert first._keys_by_word == second._keys_by_word